@@ -0,0 +1,29 @@
+"""Data loading helpers for dashboard pages."""
+
+import pandas as pd
+from snowflake.snowpark import Session
+
+# Period bounds arrive as Python date objects; parsed to datetime64 on load
+PERIOD_DATE_COLUMNS = ("period_start_date", "period_end_date")
+
+
+def query_to_pandas(session: Session, sql: str) -> pd.DataFrame:
+    """
+    Run a query and return it with lowercase columns and parsed period dates.
+
+    Call this from st.cache_data loaders so dates are parsed once per cache fill
+    rather than by every filter and chart on each rerun.
+
+    Args:
+        session: Snowpark session
+        sql: Query to run
+
+    Returns:
+        DataFrame with lowercase column names and datetime64 period date columns
+    """
+    df = session.sql(sql).to_pandas()
+    df.columns = df.columns.str.lower()
+    for col in PERIOD_DATE_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col])
+    return df
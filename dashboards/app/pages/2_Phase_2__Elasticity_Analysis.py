@@ -38,6 +38,7 @@ from thorchain_fee_analysis.visualization.charts import (
 
 # Import formatting utilities
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from components.data import query_to_pandas
 from components.formatting import format_bps, format_currency
 
 st.set_page_config(page_title="Elasticity Analysis", page_icon="📊", layout="wide")
@@ -52,9 +53,7 @@ def get_snowpark_session() -> Session:
 def load_elasticity_inputs(_session: Session) -> pd.DataFrame:
     """Load elasticity inputs from Snowflake mart."""
     sql = 'SELECT * FROM "9R".FEE_EXPERIMENT_MARTS.FCT_ELASTICITY_INPUTS ORDER BY period_start_date'
-    df = _session.sql(sql).to_pandas()
-    df.columns = df.columns.str.lower()
-    return df
+    return query_to_pandas(_session, sql)
 
 
 @st.cache_data(show_spinner=False, ttl=60)
@@ -81,9 +80,16 @@ def load_weekly_summary(_session: Session) -> pd.DataFrame:
     FROM "9R".FEE_EXPERIMENT_MARTS.FCT_ELASTICITY_INPUTS
     ORDER BY period_start_date
     """
-    df = _session.sql(sql).to_pandas()
-    df.columns = df.columns.str.lower()
-    return df
+    return query_to_pandas(_session, sql)
+
+
+@st.cache_data(show_spinner=False, ttl=60)
+def build_lightweight_configs(elasticity_df: pd.DataFrame) -> tuple[list[dict], list[dict]]:
+    """Build fee-change overlay configs, cached on the frame contents across reruns."""
+    return (
+        create_fee_revenue_lightweight_chart(elasticity_df),
+        create_fee_volume_lightweight_chart(elasticity_df),
+    )
 
 
 def generate_markdown_report(
@@ -433,8 +439,8 @@ def main():
 
     # Show the time period covered
     if len(decomp_results) > 0:
-        first_period = pd.to_datetime(weekly_df["period_start_date"].min()).strftime("%Y-%m-%d")
-        last_period = pd.to_datetime(weekly_df["period_end_date"].max()).strftime("%Y-%m-%d")
+        first_period = weekly_df["period_start_date"].min().strftime("%Y-%m-%d")
+        last_period = weekly_df["period_end_date"].max().strftime("%Y-%m-%d")
         n_periods = len(decomp_results)
         st.caption(
             f"📅 Analysis Period: {first_period} to {last_period} ({n_periods} period transitions)"
@@ -580,7 +586,7 @@ def main():
         - Double-click to reset view
         """)
 
-    revenue_config = create_fee_revenue_lightweight_chart(elasticity_df)
+    revenue_config, volume_config = build_lightweight_configs(elasticity_df)
     renderLightweightCharts(revenue_config, "fee_revenue_overlay")
 
     st.markdown("---")
@@ -618,7 +624,6 @@ def main():
         - Double-click to reset view
         """)
 
-    volume_config = create_fee_volume_lightweight_chart(elasticity_df)
     renderLightweightCharts(volume_config, "fee_volume_overlay")
 
     st.markdown("---")
@@ -693,9 +698,7 @@ def main():
     ].copy()
 
     # Format columns
-    display_df["period_start_date"] = pd.to_datetime(display_df["period_start_date"]).dt.strftime(
-        "%Y-%m-%d"
-    )
+    display_df["period_start_date"] = display_df["period_start_date"].dt.strftime("%Y-%m-%d")
     display_df["volume_usd"] = display_df["volume_usd"].apply(lambda x: format_currency(x, 0))
     display_df["fees_usd"] = display_df["fees_usd"].apply(lambda x: format_currency(x, 0))
     display_df["final_fee_bps"] = display_df["final_fee_bps"].apply(format_bps)
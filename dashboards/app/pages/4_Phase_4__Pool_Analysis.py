@@ -32,6 +32,7 @@ from thorchain_fee_analysis.visualization.charts import (
 
 # Import formatting utilities
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from components.data import query_to_pandas
 from components.formatting import format_bps, format_currency, format_percent
 
 st.set_page_config(page_title="Pool Analysis", page_icon="🏊", layout="wide")
@@ -46,27 +47,21 @@ def get_snowpark_session() -> Session:
 def load_pool_summary(_session: Session) -> pd.DataFrame:
     """Load pool weekly summary data."""
     sql = 'SELECT * FROM "9R".FEE_EXPERIMENT.V_POOL_WEEKLY_SUMMARY ORDER BY period_start_date, volume_usd DESC'
-    df = _session.sql(sql).to_pandas()
-    df.columns = df.columns.str.lower()
-    return df
+    return query_to_pandas(_session, sql)
 
 
 @st.cache_data(show_spinner=False, ttl=60)
 def load_pool_elasticity_inputs(_session: Session) -> pd.DataFrame:
     """Load pool elasticity inputs from marts."""
     sql = 'SELECT * FROM "9R".FEE_EXPERIMENT_MARTS.FCT_POOL_ELASTICITY_INPUTS ORDER BY period_start_date, pool_name'
-    df = _session.sql(sql).to_pandas()
-    df.columns = df.columns.str.lower()
-    return df
+    return query_to_pandas(_session, sql)
 
 
 @st.cache_data(show_spinner=False, ttl=60)
 def load_weekly_summary(_session: Session) -> pd.DataFrame:
     """Load weekly summary for reconciliation."""
     sql = 'SELECT * FROM "9R".FEE_EXPERIMENT.V_WEEKLY_SUMMARY_FINAL ORDER BY period_start_date'
-    df = _session.sql(sql).to_pandas()
-    df.columns = df.columns.str.lower()
-    return df
+    return query_to_pandas(_session, sql)
 
 
 def reconcile_pool_totals(pool_df: pd.DataFrame, weekly_df: pd.DataFrame) -> dict:
@@ -180,8 +175,8 @@ def main():
     selected_pool_type = st.sidebar.selectbox("Pool Type", pool_types, index=0)
 
     # Date range filter
-    min_date = pd.to_datetime(pool_df["period_start_date"].min()).date()
-    max_date = pd.to_datetime(pool_df["period_end_date"].max()).date()
+    min_date = pool_df["period_start_date"].min().date()
+    max_date = pool_df["period_end_date"].max().date()
     date_range = st.sidebar.date_input(
         "Date Range",
         value=(min_date, max_date),
@@ -197,15 +192,16 @@ def main():
     selected_fees = st.sidebar.multiselect("Fee Tiers (bps)", fee_tiers, default=fee_tiers)
 
     # Apply filters
-    filtered_df = pool_df.copy()
+    # Boolean filters below return new frames, so no defensive copy is needed
+    filtered_df = pool_df
     if selected_pool_type != "All":
         filtered_df = filtered_df[filtered_df["pool_type"] == selected_pool_type]
 
     if isinstance(date_range, tuple) and len(date_range) == 2:
         start_date, end_date = date_range
         filtered_df = filtered_df[
-            (pd.to_datetime(filtered_df["period_start_date"]).dt.date >= start_date)
-            & (pd.to_datetime(filtered_df["period_end_date"]).dt.date <= end_date)
+            (filtered_df["period_start_date"].dt.date >= start_date)
+            & (filtered_df["period_end_date"].dt.date <= end_date)
         ]
 
     if selected_fees:
@@ -300,7 +296,7 @@ def main():
 
     if len(filtered_df) > 0:
         # Standardize pool types for treemap (it expects BTC, ETH, STABLE, LONG_TAIL)
-        treemap_df = filtered_df.copy()
+        treemap_df = filtered_df[["pool_name", "pool_type", "fees_usd"]].copy()
         treemap_df["pool_type_std"] = (
             treemap_df["pool_type"]
             .map(
@@ -376,7 +372,7 @@ def main():
     """)
 
     # Filter elasticity data to match main filters
-    elasticity_filtered = elasticity_df.copy()
+    elasticity_filtered = elasticity_df
     if selected_pool_type != "All":
         # Map pool_type in elasticity (standardized) to pool_df pool_type
         type_mapping = {
@@ -392,8 +388,8 @@ def main():
     if isinstance(date_range, tuple) and len(date_range) == 2:
         start_date, end_date = date_range
         elasticity_filtered = elasticity_filtered[
-            (pd.to_datetime(elasticity_filtered["period_start_date"]).dt.date >= start_date)
-            & (pd.to_datetime(elasticity_filtered["period_end_date"]).dt.date <= end_date)
+            (elasticity_filtered["period_start_date"].dt.date >= start_date)
+            & (elasticity_filtered["period_end_date"].dt.date <= end_date)
         ]
 
     if selected_fees:
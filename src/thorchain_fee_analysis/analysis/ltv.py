@@ -133,10 +133,9 @@ def bootstrap_ltv_ci(
     weekly_discount = (1 + discount_rate) ** (1 / 52)
     user_ltvs = []
 
-    for _, user_row in cohort_users.iterrows():
-        user_address = user_row["user_address"]
-        first_period = user_row["first_seen_period_id"]
-
+    for user_address, first_period in cohort_users[
+        ["user_address", "first_seen_period_id"]
+    ].itertuples(index=False, name=None):
         user_activity = user_df[
             (user_df["user_address"] == user_address)
             & (user_df["period_id"] >= first_period)
@@ -220,14 +219,10 @@ def add_ltv_confidence_intervals(
     """
     ci_data = []
 
-    for _, row in ltv_df.iterrows():
+    ci_inputs = ltv_df[["acquisition_fee_bps", "horizon", "discount_rate"]]
+    for fee_bps, horizon, discount_rate in ci_inputs.itertuples(index=False, name=None):
         _, ci_low, ci_high = bootstrap_ltv_ci(
-            cohort_df,
-            user_df,
-            row["acquisition_fee_bps"],
-            row["horizon"],
-            row["discount_rate"],
-            n_bootstrap=n_bootstrap,
+            cohort_df, user_df, fee_bps, horizon, discount_rate, n_bootstrap=n_bootstrap
         )
         ci_data.append({"ci_low": ci_low, "ci_high": ci_high})
 
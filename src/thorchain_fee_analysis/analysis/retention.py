@@ -201,10 +201,8 @@ def add_retention_confidence_intervals(
     """
     ci_data = []
 
-    for _, row in retention_df.iterrows():
-        _, ci_low, ci_high = bootstrap_retention_ci(
-            cohort_df, row["acquisition_fee_bps"], row["k"], n_bootstrap=n_bootstrap
-        )
+    for fee_bps, k in retention_df[["acquisition_fee_bps", "k"]].itertuples(index=False, name=None):
+        _, ci_low, ci_high = bootstrap_retention_ci(cohort_df, fee_bps, k, n_bootstrap=n_bootstrap)
         ci_data.append({"ci_low": ci_low, "ci_high": ci_high})
 
     ci_df = pd.DataFrame(ci_data)
@@ -7,18 +7,13 @@ This module provides functions to:
 - Estimate elasticity by segment
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 import statsmodels.api as sm
 
-# Default segment thresholds (USD)
-DEFAULT_THRESHOLDS = {
-    "micro": (0, 100),
-    "small": (100, 1_000),
-    "medium": (1_000, 10_000),
-    "large": (10_000, 100_000),
-    "whale": (100_000, float("inf")),
-}
+from thorchain_fee_analysis.utils.segments import DEFAULT_THRESHOLDS
 
 
 def assign_trade_size_segment(
@@ -56,7 +51,9 @@ def compute_segment_metrics(user_df: pd.DataFrame, weekly_df: pd.DataFrame = Non
     Compute segment-level metrics by period.
 
     Args:
-        user_df: User-period detail with 'segment' column
+        user_df: User-period detail with 'segment' column. Must be at the
+                 user-period grain (one row per user per period), as returned
+                 by load_user_period_detail(), so group size equals user count.
         weekly_df: Optional weekly summary for total volume/fees
 
     Returns:
@@ -66,18 +63,27 @@ def compute_segment_metrics(user_df: pd.DataFrame, weekly_df: pd.DataFrame = Non
         - volume_share, fees_share (if weekly_df provided)
         - avg_fees_paid_usd, retention_rate
     """
-    # Aggregate by period and segment
+    # Split rows by period once; reused for aggregation and retention below
+    by_period = dict(list(user_df.groupby("period_id", sort=True)))
+
+    # Aggregate by period and segment one period at a time, so groupby hash
+    # tables stay period-sized (rows are unique per user-period, so counting
+    # rows gives the distinct user count without hashing addresses)
+    group_cols = ["period_id", "period_start_date", "final_fee_bps", "segment"]
+    agg_spec = {
+        "user_address": "size",
+        "volume_usd": "sum",
+        "fees_usd": "sum",
+        "swaps_count": "sum",
+    }
+    # An empty user_df has no periods; aggregate it directly to keep the columns
+    chunks = [
+        period_df.groupby(group_cols, observed=True, sort=False).agg(agg_spec)
+        for period_df in by_period.values()
+    ] or [user_df.groupby(group_cols, observed=True, sort=False).agg(agg_spec)]
+    # Order the (small) aggregate once instead of sorting keys inside every groupby
     segment_agg = (
-        user_df.groupby(["period_id", "period_start_date", "final_fee_bps", "segment"])
-        .agg(
-            {
-                "user_address": "nunique",
-                "volume_usd": "sum",
-                "fees_usd": "sum",
-                "swaps_count": "sum",
-            }
-        )
-        .reset_index()
+        pd.concat(chunks).reset_index().sort_values(["period_id", "segment"], ignore_index=True)
     )
 
     segment_agg.columns = [
@@ -109,18 +115,23 @@ def compute_segment_metrics(user_df: pd.DataFrame, weekly_df: pd.DataFrame = Non
     # For each period-segment, count how many users are also in next period
     retention_data = []
 
-    for period_id in sorted(user_df["period_id"].unique())[:-1]:  # Exclude last period
-        next_period_id = period_id + 1
+    # Cache the period/segment lists instead of rescanning user_df per iteration
+    periods = list(by_period)[:-1]  # Exclude last period
+    if isinstance(user_df["segment"].dtype, pd.CategoricalDtype):
+        segments = user_df["segment"].cat.categories
+    else:
+        segments = user_df["segment"].unique()
+
+    for period_id in periods:
+        period_users = by_period[period_id]
+        next_period = by_period.get(period_id + 1)
+        next_period_users = set(next_period["user_address"]) if next_period is not None else set()
 
-        for segment in user_df["segment"].unique():
+        for segment in segments:
             current_users = set(
-                user_df[(user_df["period_id"] == period_id) & (user_df["segment"] == segment)][
-                    "user_address"
-                ]
+                period_users.loc[period_users["segment"] == segment, "user_address"]
             )
 
-            next_period_users = set(user_df[user_df["period_id"] == next_period_id]["user_address"])
-
             retained = len(current_users & next_period_users)
             retention_rate = retained / len(current_users) if len(current_users) > 0 else 0
 
@@ -128,7 +139,7 @@ def compute_segment_metrics(user_df: pd.DataFrame, weekly_df: pd.DataFrame = Non
                 {"period_id": period_id, "segment": segment, "retention_rate": retention_rate}
             )
 
-    retention_df = pd.DataFrame(retention_data)
+    retention_df = pd.DataFrame(retention_data, columns=["period_id", "segment", "retention_rate"])
 
     # Merge retention back
     segment_agg = segment_agg.merge(retention_df, on=["period_id", "segment"], how="left")
@@ -136,17 +147,110 @@ def compute_segment_metrics(user_df: pd.DataFrame, weekly_df: pd.DataFrame = Non
     return segment_agg
 
 
+def _nan_elasticity_result(segment: str, n_obs: int) -> dict:
+    """Build an elasticity result row with no estimate."""
+    return {
+        "segment": segment,
+        "elasticity": np.nan,
+        "std_error": np.nan,
+        "pvalue": np.nan,
+        "ci_low": np.nan,
+        "ci_high": np.nan,
+        "r_squared": np.nan,
+        "n_obs": n_obs,
+    }
+
+
+def _fit_segment_elasticity(
+    segment: str, seg_data: pd.DataFrame, controls: pd.DataFrame = None
+) -> dict:
+    """
+    Fit log(volume) ~ fee_bps + time_trend (+ controls) for a single segment.
+
+    Args:
+        segment: Segment name
+        seg_data: Segment metrics rows for this segment only, sorted by period_id
+        controls: Optional DataFrame with control variables indexed by period_id
+
+    Returns:
+        Dict with elasticity estimate and fit statistics
+    """
+    # Skip if insufficient data
+    if len(seg_data) < 3:
+        return _nan_elasticity_result(segment, len(seg_data))
+
+    seg_data = seg_data.copy()
+
+    # Prepare regression data in float64 (loaders may hand us float32 amounts)
+    volume = seg_data["volume_usd"].to_numpy(dtype=np.float64)
+    seg_data["log_volume"] = np.log1p(volume)  # log(1 + v) handles zeros
+
+    # Independent variables
+    x_vars = seg_data[["final_fee_bps"]].astype(np.float64)
+
+    # Add time trend (seg_data is sorted by period_id)
+    x_vars["time_trend"] = np.arange(len(x_vars), dtype=np.int32)
+
+    # Add controls if provided
+    if controls is not None:
+        x_vars = x_vars.merge(controls, left_on="period_id", right_index=True, how="left")
+
+    # Add constant
+    x_vars = sm.add_constant(x_vars)
+
+    # Dependent variable
+    y = seg_data["log_volume"]
+
+    try:
+        # No fee variation (or otherwise collinear regressors) is the common
+        # failure; detect it up front rather than relying on the except below
+        design = x_vars.to_numpy(dtype=np.float64)
+        if (
+            np.var(design[:, x_vars.columns.get_loc("final_fee_bps")]) == 0
+            or np.linalg.matrix_rank(design) < design.shape[1]
+        ):
+            result = _nan_elasticity_result(segment, len(seg_data))
+            result["error"] = "Rank-deficient design matrix"
+            return result
+
+        # Fit OLS model
+        model = sm.OLS(y, x_vars).fit()
+
+        # 95% confidence interval
+        conf_int = model.conf_int(alpha=0.05)
+
+        return {
+            "segment": segment,
+            "elasticity": model.params["final_fee_bps"],
+            "std_error": model.bse["final_fee_bps"],
+            "pvalue": model.pvalues["final_fee_bps"],
+            "ci_low": conf_int.loc["final_fee_bps", 0],
+            "ci_high": conf_int.loc["final_fee_bps", 1],
+            "r_squared": model.rsquared,
+            "n_obs": len(seg_data),
+        }
+    except Exception as e:
+        # Handle regression failures
+        result = _nan_elasticity_result(segment, len(seg_data))
+        result["error"] = str(e)
+        return result
+
+
 def estimate_segment_elasticity(
-    segment_df: pd.DataFrame, controls: pd.DataFrame = None
+    segment_df: pd.DataFrame, controls: pd.DataFrame = None, max_workers: int | None = None
 ) -> pd.DataFrame:
     """
     Estimate price elasticity by segment using OLS regression.
 
     Models: log(volume) ~ fee_bps + controls
 
+    Segments are independent, so they are fitted concurrently on a thread
+    pool; numpy/scipy release the GIL inside the linear algebra calls.
+
     Args:
         segment_df: Segment metrics with volume_usd and final_fee_bps
         controls: Optional DataFrame with control variables
+        max_workers: Thread pool size (None lets the executor decide)
 
     Returns:
         DataFrame with columns:
@@ -155,87 +259,21 @@ def estimate_segment_elasticity(
         - std_error, pvalue, ci_low, ci_high
         - r_squared
     """
-    elasticity_results = []
-
-    for segment in sorted(segment_df["segment"].unique()):
-        seg_data = segment_df[segment_df["segment"] == segment].copy()
-
-        # Skip if insufficient data
-        if len(seg_data) < 3:
-            elasticity_results.append(
-                {
-                    "segment": segment,
-                    "elasticity": np.nan,
-                    "std_error": np.nan,
-                    "pvalue": np.nan,
-                    "ci_low": np.nan,
-                    "ci_high": np.nan,
-                    "r_squared": np.nan,
-                    "n_obs": len(seg_data),
-                }
-            )
-            continue
-
-        # Prepare regression data
-        seg_data["log_volume"] = np.log(seg_data["volume_usd"] + 1)  # Add 1 to handle zeros
-
-        # Independent variables
-        x_vars = seg_data[["final_fee_bps"]].copy()
-
-        # Add time trend
-        x_vars["time_trend"] = range(len(x_vars))
-
-        # Add controls if provided
-        if controls is not None:
-            x_vars = x_vars.merge(controls, left_on="period_id", right_index=True, how="left")
-
-        # Add constant
-        x_vars = sm.add_constant(x_vars)
-
-        # Dependent variable
-        y = seg_data["log_volume"]
-
-        try:
-            # Fit OLS model
-            model = sm.OLS(y, x_vars).fit()
-
-            # Extract fee_bps coefficient
-            fee_coef = model.params["final_fee_bps"]
-            fee_se = model.bse["final_fee_bps"]
-            fee_pval = model.pvalues["final_fee_bps"]
-
-            # 95% confidence interval
-            conf_int = model.conf_int(alpha=0.05)
-            ci_low = conf_int.loc["final_fee_bps", 0]
-            ci_high = conf_int.loc["final_fee_bps", 1]
-
-            elasticity_results.append(
-                {
-                    "segment": segment,
-                    "elasticity": fee_coef,
-                    "std_error": fee_se,
-                    "pvalue": fee_pval,
-                    "ci_low": ci_low,
-                    "ci_high": ci_high,
-                    "r_squared": model.rsquared,
-                    "n_obs": len(seg_data),
-                }
-            )
-        except Exception as e:
-            # Handle regression failures
-            elasticity_results.append(
-                {
-                    "segment": segment,
-                    "elasticity": np.nan,
-                    "std_error": np.nan,
-                    "pvalue": np.nan,
-                    "ci_low": np.nan,
-                    "ci_high": np.nan,
-                    "r_squared": np.nan,
-                    "n_obs": len(seg_data),
-                    "error": str(e),
-                }
+    # Sort once so each segment's rows are in period order for the time trend
+    segment_df = segment_df.sort_values(["segment", "period_id"], kind="mergesort").reset_index(
+        drop=True
+    )
+    segments = sorted(segment_df["segment"].unique())
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        elasticity_results = list(
+            executor.map(
+                lambda segment: _fit_segment_elasticity(
+                    segment, segment_df[segment_df["segment"] == segment], controls
+                ),
+                segments,
             )
+        )
 
     return pd.DataFrame(elasticity_results)
 
@@ -253,7 +291,9 @@ def add_elasticity_to_metrics(
     Returns:
         segment_df with added elasticity column
     """
-    return segment_df.merge(elasticity_df[["segment", "elasticity"]], on="segment", how="left")
+    # elasticity_df has one row per segment, so a map lookup replaces the merge
+    elasticity_by_segment = elasticity_df.set_index("segment")["elasticity"]
+    return segment_df.assign(elasticity=segment_df["segment"].map(elasticity_by_segment))
 
 
 def get_segment_summary(segment_df: pd.DataFrame) -> pd.DataFrame:
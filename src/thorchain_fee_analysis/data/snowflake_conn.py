@@ -4,12 +4,13 @@ This module provides a unified interface for connecting to Snowflake across
 different environments (Streamlit, local development, CI/CD).
 
 Connection methods (in order of precedence):
-1. Streamlit secrets (when running in Streamlit Cloud)
+1. Streamlit secrets (when running under Streamlit)
 2. ~/.snowflake/connections.toml (default profile '9R')
 3. Environment variables (SNOWFLAKE_*)
 """
 
 import os
+import sys
 from pathlib import Path
 
 from snowflake.snowpark import Session
@@ -24,6 +25,7 @@ def get_snowpark_session(
     Args:
         profile: Profile name to use from ~/.snowflake/connections.toml
         use_streamlit_secrets: Whether to attempt using Streamlit secrets first
+            (only tried when streamlit has already been imported)
 
     Returns:
         Snowflake Snowpark Session
@@ -31,8 +33,9 @@ def get_snowpark_session(
     Raises:
         RuntimeError: If no valid connection configuration is found
     """
-    # Method 1: Try Streamlit secrets (when available)
-    if use_streamlit_secrets:
+    # Method 1: Try Streamlit secrets (only when already running under Streamlit;
+    # importing streamlit from a CLI/CI process is slow and never has secrets)
+    if use_streamlit_secrets and "streamlit" in sys.modules:
         try:
             import streamlit as st
 
@@ -5,9 +5,132 @@ This module builds user-period detail data from swap-level data when
 database views are not available.
 """
 
+import numpy as np
 import pandas as pd
 from snowflake.snowpark import Session
 
+from thorchain_fee_analysis.utils.segments import DEFAULT_THRESHOLDS
+
+# One row per user per period, built from swap-level data
+USER_PERIOD_DETAIL_SQL = """
+WITH swaps_with_period AS (
+    SELECT
+        s.*,
+        p.period_id,
+        p.period_start_date,
+        p.period_end_date,
+        p.intended_fee_bps AS final_fee_bps,
+        MIN(s.swap_date) OVER (PARTITION BY s.from_address) AS first_swap_date_in_window
+    FROM "9R".FEE_EXPERIMENT.V_SWAPS_EXPERIMENT_WINDOW s
+    LEFT JOIN "9R".FEE_EXPERIMENT.V_FEE_PERIODS_MANUAL p
+        ON s.swap_date BETWEEN p.period_start_date AND p.period_end_date
+),
+
+user_period_agg AS (
+    SELECT
+        period_id,
+        period_start_date,
+        period_end_date,
+        final_fee_bps,
+        from_address AS user_address,
+        MIN(first_swap_date_in_window) AS first_swap_date_in_window,
+        COUNT(*) AS swaps_count,
+        SUM(gross_volume_usd) AS volume_usd,
+        SUM(total_fee_usd) AS fees_usd,
+        AVG(gross_volume_usd) AS avg_swap_size_usd,
+        MEDIAN(gross_volume_usd) AS median_swap_size_usd,
+        COUNT(DISTINCT pool_name) AS distinct_pools_used,
+        COUNT(DISTINCT swap_date) AS active_days
+    FROM swaps_with_period
+    WHERE period_id IS NOT NULL
+    GROUP BY 1, 2, 3, 4, 5
+)
+
+SELECT
+    period_id,
+    period_start_date,
+    period_end_date,
+    final_fee_bps,
+    user_address,
+    swaps_count,
+    volume_usd,
+    fees_usd,
+    avg_swap_size_usd,
+    median_swap_size_usd,
+    distinct_pools_used,
+    active_days,
+
+    -- User classification
+    CASE
+        WHEN first_swap_date_in_window >= period_start_date
+            AND first_swap_date_in_window <= period_end_date
+        THEN 'New'
+        ELSE 'Returning'
+    END AS user_cohort,
+
+    -- User engagement level
+    CASE
+        WHEN swaps_count >= 10 THEN 'Power User'
+        WHEN swaps_count >= 5 THEN 'Regular'
+        WHEN swaps_count >= 2 THEN 'Occasional'
+        ELSE 'One-time'
+    END AS engagement_level,
+
+    -- First seen date for cohort analysis
+    first_swap_date_in_window
+
+FROM user_period_agg
+"""
+
+# User-period columns that fit in narrower dtypes than Snowflake's defaults
+_INTEGER_COLUMNS = [
+    "period_id",
+    "swaps_count",
+    "distinct_pools_used",
+    "active_days",
+    "final_fee_bps",
+]
+# volume_usd stays float64: it drives segment classification, and float32 rounding
+# moves values such as 999.99997 across the segment thresholds
+_FLOAT32_COLUMNS = ["fees_usd", "avg_swap_size_usd", "median_swap_size_usd"]
+
+
+def _sql_to_pandas(session: Session, sql: str) -> pd.DataFrame:
+    """
+    Run a query and return it as pandas with lowercase column names.
+
+    Snowflake returns uppercase identifiers; renaming on the Arrow table
+    avoids building and reassigning a second pandas Index after conversion.
+    Snowpark releases without DataFrame.to_arrow fall back to to_pandas().
+    """
+    snowpark_df = session.sql(sql)
+    if not hasattr(snowpark_df, "to_arrow"):
+        df = snowpark_df.to_pandas()
+        df.columns = df.columns.str.lower()
+        return df
+
+    table = snowpark_df.to_arrow()
+    table = table.rename_columns([name.lower() for name in table.column_names])
+    return table.to_pandas()
+
+
+def _narrow_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast user-period numeric columns to halve memory in later groupbys.
+
+    Counts and ids become the smallest integer type that holds them. Fee and
+    swap-size amounts become float32, which is fine for aggregation and display;
+    regressions cast back to float64 before fitting. volume_usd keeps float64
+    so segment assignment matches the exact thresholds used in SQL.
+    """
+    for col in _INTEGER_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+    for col in _FLOAT32_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(np.float32)
+    return df
+
 
 def load_user_period_detail(session: Session) -> pd.DataFrame:
     """
@@ -27,80 +150,12 @@ def load_user_period_detail(session: Session) -> pd.DataFrame:
         - user_cohort ('New' or 'Returning')
         - engagement_level, first_swap_date_in_window
     """
-    sql = """
-    WITH swaps_with_period AS (
-        SELECT
-            s.*,
-            p.period_id,
-            p.period_start_date,
-            p.period_end_date,
-            p.intended_fee_bps AS final_fee_bps,
-            MIN(s.swap_date) OVER (PARTITION BY s.from_address) AS first_swap_date_in_window
-        FROM "9R".FEE_EXPERIMENT.V_SWAPS_EXPERIMENT_WINDOW s
-        LEFT JOIN "9R".FEE_EXPERIMENT.V_FEE_PERIODS_MANUAL p
-            ON s.swap_date BETWEEN p.period_start_date AND p.period_end_date
-    ),
-
-    user_period_agg AS (
-        SELECT
-            period_id,
-            period_start_date,
-            period_end_date,
-            final_fee_bps,
-            from_address AS user_address,
-            MIN(first_swap_date_in_window) AS first_swap_date_in_window,
-            COUNT(*) AS swaps_count,
-            SUM(gross_volume_usd) AS volume_usd,
-            SUM(total_fee_usd) AS fees_usd,
-            AVG(gross_volume_usd) AS avg_swap_size_usd,
-            MEDIAN(gross_volume_usd) AS median_swap_size_usd,
-            COUNT(DISTINCT pool_name) AS distinct_pools_used,
-            COUNT(DISTINCT swap_date) AS active_days
-        FROM swaps_with_period
-        WHERE period_id IS NOT NULL
-        GROUP BY 1, 2, 3, 4, 5
-    )
-
-    SELECT
-        period_id,
-        period_start_date,
-        period_end_date,
-        final_fee_bps,
-        user_address,
-        swaps_count,
-        volume_usd,
-        fees_usd,
-        avg_swap_size_usd,
-        median_swap_size_usd,
-        distinct_pools_used,
-        active_days,
-
-        -- User classification
-        CASE
-            WHEN first_swap_date_in_window >= period_start_date
-                AND first_swap_date_in_window <= period_end_date
-            THEN 'New'
-            ELSE 'Returning'
-        END AS user_cohort,
-
-        -- User engagement level
-        CASE
-            WHEN swaps_count >= 10 THEN 'Power User'
-            WHEN swaps_count >= 5 THEN 'Regular'
-            WHEN swaps_count >= 2 THEN 'Occasional'
-            ELSE 'One-time'
-        END AS engagement_level,
-
-        -- First seen date for cohort analysis
-        first_swap_date_in_window
-
-    FROM user_period_agg
+    sql = f"""
+    {USER_PERIOD_DETAIL_SQL}
     ORDER BY period_start_date, volume_usd DESC
     """
 
-    df = session.sql(sql).to_pandas()
-    df.columns = df.columns.str.lower()
-    return df
+    return _narrow_dtypes(_sql_to_pandas(session, sql))
 
 
 def load_weekly_summary(session: Session) -> pd.DataFrame:
@@ -114,6 +169,77 @@ def load_weekly_summary(session: Session) -> pd.DataFrame:
         DataFrame with weekly aggregated metrics
     """
     sql = 'SELECT * FROM "9R".FEE_EXPERIMENT.V_WEEKLY_SUMMARY_FINAL ORDER BY period_start_date'
-    df = session.sql(sql).to_pandas()
-    df.columns = df.columns.str.lower()
-    return df
+    return _sql_to_pandas(session, sql)
+
+
+def _segment_case_sql(thresholds: dict[str, tuple[float, float]]) -> str:
+    """Build a SQL CASE expression mirroring assign_trade_size_segment()."""
+    whens = []
+    for segment_name, (min_val, max_val) in thresholds.items():
+        if max_val == float("inf"):
+            whens.append(f"WHEN volume_usd >= {min_val} THEN '{segment_name}'")
+        else:
+            whens.append(
+                f"WHEN volume_usd >= {min_val} AND volume_usd < {max_val} THEN '{segment_name}'"
+            )
+    return "CASE " + " ".join(whens) + " ELSE 'whale' END"
+
+
+def load_segment_metrics(
+    session: Session, thresholds: dict[str, tuple[float, float]] = None
+) -> pd.DataFrame:
+    """
+    Load segment-level metrics by period, aggregated in Snowflake.
+
+    Segments are assigned with the same thresholds as
+    assign_trade_size_segment(), so per-user rows never leave the warehouse.
+
+    Args:
+        session: Snowpark session
+        thresholds: Dict of segment_name -> (min_usd, max_usd)
+                   If None, uses DEFAULT_THRESHOLDS
+
+    Returns:
+        DataFrame with columns:
+        - period_id, period_start_date, final_fee_bps, segment
+        - user_count, volume_usd, fees_usd, swaps_count
+        - avg_fees_paid_usd
+        - volume_share, fees_share (share of the period's total across segments)
+
+    Note:
+        volume_share and fees_share here are shares of the period's segment sum.
+        compute_segment_metrics() computes the same-named columns as shares of the
+        V_WEEKLY_SUMMARY_FINAL totals, so the two are not interchangeable.
+    """
+    if thresholds is None:
+        thresholds = DEFAULT_THRESHOLDS
+
+    sql = f"""
+    WITH user_period AS (
+        {USER_PERIOD_DETAIL_SQL}
+    ),
+
+    segment_agg AS (
+        SELECT
+            period_id,
+            period_start_date,
+            final_fee_bps,
+            {_segment_case_sql(thresholds)} AS segment,
+            COUNT(DISTINCT user_address) AS user_count,
+            SUM(volume_usd) AS volume_usd,
+            SUM(fees_usd) AS fees_usd,
+            SUM(swaps_count) AS swaps_count,
+            SUM(fees_usd) / NULLIF(COUNT(DISTINCT user_address), 0) AS avg_fees_paid_usd
+        FROM user_period
+        GROUP BY 1, 2, 3, 4
+    )
+
+    SELECT
+        *,
+        volume_usd / NULLIF(SUM(volume_usd) OVER (PARTITION BY period_id), 0) AS volume_share,
+        fees_usd / NULLIF(SUM(fees_usd) OVER (PARTITION BY period_id), 0) AS fees_share
+    FROM segment_agg
+    ORDER BY period_start_date, segment
+    """
+
+    return _sql_to_pandas(session, sql)
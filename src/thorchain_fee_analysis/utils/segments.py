@@ -0,0 +1,12 @@
+"""
+Trade-size segment definitions shared by the data and analysis layers.
+"""
+
+# Default segment thresholds (USD)
+DEFAULT_THRESHOLDS = {
+    "micro": (0, 100),
+    "small": (100, 1_000),
+    "medium": (1_000, 10_000),
+    "large": (10_000, 100_000),
+    "whale": (100_000, float("inf")),
+}
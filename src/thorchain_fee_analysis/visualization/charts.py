@@ -3,58 +3,260 @@ Reusable chart builders for elasticity and revenue analysis.
 Provides composite visualizations that overlay independent and dependent variables.
 """
 
-import altair as alt
+from typing import TYPE_CHECKING
+
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+
+# Plotting libraries are imported inside the builders; importing them here would add
+# roughly half a second to the cold import of this module
+if TYPE_CHECKING:
+    import altair as alt
+    import plotly.graph_objects as go
+
+# Upper bound on points sent to the browser for a single time series
+MAX_CHART_POINTS = 2000
+
+# Series longer than this render with WebGL (Scattergl) instead of SVG
+WEBGL_MIN_POINTS = 1000
+
+# Line charts drop per-point markers at or above this many points
+MARKER_MAX_POINTS = 200
+
+# Scatter plots shrink their circles above this many points to limit overdraw
+_DENSE_SCATTER_POINTS = 500
+
+_MS_PER_DAY = 24 * 60 * 60 * 1000
+
+# MinMaxLTTB preselects this many candidates per output point before running LTTB
+_MINMAX_RATIO = 4
 
 
-def create_fee_revenue_lightweight_chart(df: pd.DataFrame) -> list[dict]:
+def _as_datetime(dates: pd.Series) -> pd.Series:
     """
-    Create lightweight-charts configuration for FEE CHANGE + revenue overlay.
-    Shows DELTA in fees (what changed) vs revenue response.
+    Parse a date column, skipping the pass when it is already datetime64.
 
     Args:
-        df: DataFrame with columns: period_start_date, final_fee_bps, prev_fee_bps,
-                                    fees_usd, pct_change_fee_bps
+        dates: Series of dates (datetime64, date objects or strings)
 
     Returns:
-        List of chart configurations for renderLightweightCharts
+        datetime64 Series
     """
-    viz_df = df.copy()
-    viz_df["period_start_date"] = pd.to_datetime(viz_df["period_start_date"])
+    if is_datetime64_any_dtype(dates):
+        return dates
+    return pd.to_datetime(dates)
 
-    # Calculate fee change in bps (delta)
-    viz_df["fee_change_bps"] = viz_df["final_fee_bps"] - viz_df["prev_fee_bps"]
 
-    # Convert dates to Unix timestamps (seconds)
-    viz_df["timestamp"] = (viz_df["period_start_date"].astype(int) / 10**9).astype(int)
+def _unix_seconds(dates: pd.Series) -> np.ndarray:
+    """
+    Convert a datetime column to integer Unix timestamps (seconds).
 
-    # Prepare FEE CHANGE data (area chart showing +/- changes)
-    # Include current fee and change for tooltip
-    fee_change_data = [
-        {
-            "time": int(row["timestamp"]),
-            "value": float(row["fee_change_bps"]),
-            "title": f"Fee: {row['final_fee_bps']:.0f} bps ({row['fee_change_bps']:+.0f})",
-        }
-        for _, row in viz_df.iterrows()
-    ]
+    Args:
+        dates: datetime64 Series of any resolution (ns, us, s), naive or tz-aware
+
+    Returns:
+        int64 array of seconds since the epoch
+    """
+    # numpy has no tz-aware datetimes; normalize to naive UTC first
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        dates = dates.dt.tz_convert(None)
+
+    # Cast via datetime64[s] so the result doesn't depend on the column's storage unit
+    return dates.to_numpy().astype("datetime64[s]").astype(np.int64)
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select point indices with Largest-Triangle-Three-Buckets downsampling.
+
+    Args:
+        x: Monotonic x values
+        y: Series values
+        n_out: Number of points to keep (first and last are always kept)
+
+    Returns:
+        Sorted array of selected indices
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Interior points are split into n_out - 2 buckets; the last point forms a final bucket
+    edges = np.append(np.linspace(1, n - 1, n_out - 1).astype(np.int64), n)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    # Bucket means don't depend on earlier picks, so compute them all up front
+    bucket_sizes = np.diff(edges)
+    mean_x = np.add.reduceat(x, edges[:-1]) / bucket_sizes
+    mean_y = np.add.reduceat(y, edges[:-1]) / bucket_sizes
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+
+        # Keep the point forming the largest triangle with the previous pick and next bucket mean
+        area = np.abs(
+            (x[a] - mean_x[i + 1]) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (mean_y[i + 1] - y[a])
+        )
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+
+    return selected
+
+
+def _minmax_indices(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """
+    Select the min and max point of each equal-width bucket (plus both endpoints).
+
+    Args:
+        y: Series values
+        n_buckets: Number of buckets; len(y) should be well above 2 * n_buckets
+
+    Returns:
+        Sorted array of unique selected indices
+    """
+    n = len(y)
+    size = n // n_buckets
+    buckets = y[: size * n_buckets].reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+
+    # Leftover tail (fewer than `size` points) is kept whole
+    return np.unique(
+        np.concatenate(
+            [
+                [0, n - 1],
+                offsets + buckets.argmin(axis=1),
+                offsets + buckets.argmax(axis=1),
+                np.arange(size * n_buckets, n),
+            ]
+        )
+    )
 
-    # Prepare revenue data (line chart - PRIMARY METRIC)
-    # Include current fee for context
-    revenue_data = [
-        {
-            "time": int(row["timestamp"]),
-            "value": float(row["fees_usd"]),
-            "title": f"Revenue: ${row['fees_usd']:,.0f} | Fee: {row['final_fee_bps']:.0f} bps",
-        }
-        for _, row in viz_df.iterrows()
-    ]
 
-    # Chart configuration
-    chart_options = {
+def _downsample_periods(viz_df: pd.DataFrame, value_col: str, max_points: int) -> pd.DataFrame:
+    """
+    Downsample a period time series for rendering, keeping every fee change.
+
+    Args:
+        viz_df: DataFrame sorted by period_start_date (datetime) with final_fee_bps
+        value_col: Column whose shape LTTB should preserve
+        max_points: Target number of points
+
+    Returns:
+        viz_df unchanged if already small enough, otherwise the selected rows
+    """
+    if len(viz_df) <= max_points:
+        return viz_df
+
+    x = _unix_seconds(viz_df["period_start_date"]).astype(np.float64)
+    y = viz_df[value_col].to_numpy(dtype=np.float64)
+
+    # MinMaxLTTB: on very long series, run LTTB only over per-bucket extremes
+    candidates = np.arange(len(viz_df))
+    if len(viz_df) > _MINMAX_RATIO * max_points:
+        candidates = _minmax_indices(y, _MINMAX_RATIO * max_points // 2)
+    keep = candidates[_lttb_indices(x[candidates], y[candidates], max_points)]
+
+    # Fee changes are the experiment's treatment; never drop them
+    fee = viz_df["final_fee_bps"].to_numpy()
+    fee_changes = np.flatnonzero(np.diff(fee, prepend=fee[0]) != 0)
+
+    return viz_df.take(np.union1d(keep, fee_changes))
+
+
+def _top_pools(df: pd.DataFrame, value_col: str, n: int, how: str = "sum") -> pd.Index:
+    """
+    Rank pools by an aggregate of one column and return the top N pool names.
+
+    Args:
+        df: DataFrame with pool_name column (object or categorical)
+        value_col: Column to aggregate per pool
+        n: Number of pools to return
+        how: Aggregation applied per pool ("sum" or "mean")
+
+    Returns:
+        Index of the top N pool names, largest first
+    """
+    # observed=True keeps categorical pool names from expanding to pools absent from df
+    return df.groupby("pool_name", observed=True)[value_col].agg(how).nlargest(n).index
+
+
+def _regression_line(viz_df: pd.DataFrame, x_col: str, y_col: str) -> pd.DataFrame:
+    """
+    Fit an OLS line of y on x and return its endpoints over the observed x range.
+
+    Args:
+        viz_df: DataFrame with finite x and y values
+        x_col: Predictor column
+        y_col: Response column
+
+    Returns:
+        Two-row DataFrame with x_col/y_col (empty if x has no variation)
+    """
+    x = viz_df[x_col].to_numpy(dtype=np.float64)
+    y = viz_df[y_col].to_numpy(dtype=np.float64)
+    x_dev = x - x.mean()
+    ss_x = x_dev @ x_dev
+    if ss_x == 0:
+        return pd.DataFrame({x_col: [], y_col: []})
+
+    slope = (x_dev @ (y - y.mean())) / ss_x
+    xs = np.array([x.min(), x.max()])
+    return pd.DataFrame({x_col: xs, y_col: y.mean() + slope * (xs - x.mean())})
+
+
+def _finite_rows(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
+    """
+    Select cols, keeping only rows where every value is present and finite.
+
+    Args:
+        df: Source DataFrame
+        cols: Columns to keep; numeric ones must be finite, others non-null
+
+    Returns:
+        New DataFrame restricted to cols and the valid rows
+    """
+    # Build one boolean mask instead of replace(inf -> NaN) followed by dropna
+    mask = np.ones(len(df), dtype=bool)
+    for col in cols:
+        values = df[col]
+        if is_numeric_dtype(values):
+            mask &= np.isfinite(values.to_numpy(dtype=np.float64, na_value=np.nan))
+        else:
+            mask &= values.notna().to_numpy()
+    return df.loc[mask, cols]
+
+
+def _normalize_pct(values: np.ndarray) -> np.ndarray:
+    """
+    Scale values to a 0-100 index of their maximum.
+
+    Args:
+        values: Non-negative float values (NaN marks missing periods)
+
+    Returns:
+        Scaled array with NaN positions kept as NaN (zeros elsewhere if the
+        maximum is not positive)
+    """
+    present = ~np.isnan(values)
+    # Skip NaN like pandas .max(); np.max would propagate it and zero the whole series
+    max_value = np.nanmax(values) if present.any() else 0.0
+    if max_value > 0:
+        return values * (100.0 / max_value)
+    return np.where(present, 0.0, np.nan)
+
+
+def _lightweight_chart_options() -> dict:
+    """
+    Build the chart layout shared by the fee-change overlay lightweight charts.
+
+    Returns a fresh dict per call so tweaking one chart's options cannot leak
+    into charts built later.
+    """
+    return {
         "layout": {
             "textColor": "black",
             "background": {"type": "solid", "color": "white"},
@@ -71,19 +273,107 @@ def create_fee_revenue_lightweight_chart(df: pd.DataFrame) -> list[dict]:
         },
     }
 
+
+def _series_points(times: list[int], values: list[float], titles: list[str]) -> list[dict]:
+    """
+    Zip columnar times, values and titles into lightweight-charts data points.
+
+    Args:
+        times: Unix timestamps (seconds)
+        values: Numeric series values
+        titles: Preformatted tooltip titles
+
+    Returns:
+        List of {"time", "value", "title"} dicts as expected by renderLightweightCharts
+    """
+    return [{"time": t, "value": v, "title": title} for t, v, title in zip(times, values, titles)]
+
+
+def _fee_change_series(fee_change_data: list[dict]) -> dict:
+    """
+    Build the Δ fee histogram series shared by the lightweight overlay charts.
+
+    Args:
+        fee_change_data: Points from _series_points for fee_change_bps
+
+    Returns:
+        Histogram series configuration on the right price scale
+    """
+    return {
+        "type": "Histogram",
+        "data": fee_change_data,
+        "options": {
+            "color": "rgba(255, 107, 53, 0.6)",
+            "priceScaleId": "right",
+            "title": "Δ Fee (bps) - INDEPENDENT VARIABLE",
+        },
+    }
+
+
+def _fee_overlay_points(
+    df: pd.DataFrame, value_col: str, value_label: str, max_points: int
+) -> tuple[list[dict], list[dict]]:
+    """
+    Build Δ fee and metric points for a lightweight fee-change overlay chart.
+
+    Args:
+        df: DataFrame with columns: period_start_date, final_fee_bps, prev_fee_bps, value_col
+        value_col: Metric plotted against the fee change (e.g. fees_usd, volume_usd)
+        value_label: Tooltip label for the metric (e.g. "Revenue")
+        max_points: Downsample longer series to about this many points
+
+    Returns:
+        Tuple of (fee_change_data, value_data) point lists
+    """
+    viz_df = df[["period_start_date", "final_fee_bps", "prev_fee_bps", value_col]].copy()
+    viz_df["period_start_date"] = _as_datetime(viz_df["period_start_date"])
+    viz_df = _downsample_periods(viz_df, value_col, max_points)
+
+    # Calculate fee change in bps (delta), then pull plain float lists once;
+    # formatting Python floats avoids per-element pandas overhead
+    fee_array = viz_df["final_fee_bps"].to_numpy(dtype=np.float64)
+    fee_change_bps = (fee_array - viz_df["prev_fee_bps"].to_numpy(dtype=np.float64)).tolist()
+    fee_bps = fee_array.tolist()
+    values = viz_df[value_col].to_numpy(dtype=np.float64).tolist()
+
+    # One f-string per tooltip title
+    fee_titles = [
+        f"Fee: {fee:.0f} bps ({delta:+.0f})" for fee, delta in zip(fee_bps, fee_change_bps)
+    ]
+    value_titles = [
+        f"{value_label}: ${value:,.0f} | Fee: {fee:.0f} bps" for fee, value in zip(fee_bps, values)
+    ]
+
+    # Convert dates to Unix timestamps (seconds), shared by both series
+    timestamps = _unix_seconds(viz_df["period_start_date"]).tolist()
+    return (
+        _series_points(timestamps, fee_change_bps, fee_titles),
+        _series_points(timestamps, values, value_titles),
+    )
+
+
+def create_fee_revenue_lightweight_chart(
+    df: pd.DataFrame, max_points: int = MAX_CHART_POINTS
+) -> list[dict]:
+    """
+    Create lightweight-charts configuration for FEE CHANGE + revenue overlay.
+    Shows DELTA in fees (what changed) vs revenue response.
+
+    Args:
+        df: DataFrame with columns: period_start_date, final_fee_bps, prev_fee_bps,
+                                    fees_usd, pct_change_fee_bps
+        max_points: Downsample longer series to about this many points
+
+    Returns:
+        List of chart configurations for renderLightweightCharts
+    """
+    fee_change_data, revenue_data = _fee_overlay_points(df, "fees_usd", "Revenue", max_points)
+
     # Series configuration
     # Histogram for fee changes (bars with tooltips showing current fee)
     # Line for revenue
     series = [
-        {
-            "type": "Histogram",
-            "data": fee_change_data,
-            "options": {
-                "color": "rgba(255, 107, 53, 0.6)",
-                "priceScaleId": "right",
-                "title": "Δ Fee (bps) - INDEPENDENT VARIABLE",
-            },
-        },
+        _fee_change_series(fee_change_data),
         {
             "type": "Line",
             "data": revenue_data,
@@ -97,10 +387,12 @@ def create_fee_revenue_lightweight_chart(df: pd.DataFrame) -> list[dict]:
         },
     ]
 
-    return [{"chart": chart_options, "series": series}]
+    return [{"chart": _lightweight_chart_options(), "series": series}]
 
 
-def create_fee_volume_lightweight_chart(df: pd.DataFrame) -> list[dict]:
+def create_fee_volume_lightweight_chart(
+    df: pd.DataFrame, max_points: int = MAX_CHART_POINTS
+) -> list[dict]:
     """
     Create lightweight-charts configuration for FEE CHANGE + volume overlay.
     Shows DELTA in fees (what changed) vs volume response.
@@ -108,72 +400,18 @@ def create_fee_volume_lightweight_chart(df: pd.DataFrame) -> list[dict]:
     Args:
         df: DataFrame with columns: period_start_date, final_fee_bps, prev_fee_bps,
                                     volume_usd, pct_change_fee_bps
+        max_points: Downsample longer series to about this many points
 
     Returns:
         List of chart configurations for renderLightweightCharts
     """
-    viz_df = df.copy()
-    viz_df["period_start_date"] = pd.to_datetime(viz_df["period_start_date"])
-
-    # Calculate fee change in bps (delta)
-    viz_df["fee_change_bps"] = viz_df["final_fee_bps"] - viz_df["prev_fee_bps"]
-
-    # Convert dates to Unix timestamps (seconds)
-    viz_df["timestamp"] = (viz_df["period_start_date"].astype(int) / 10**9).astype(int)
-
-    # Prepare FEE CHANGE data (area chart showing +/- changes)
-    # Include current fee and change for tooltip
-    fee_change_data = [
-        {
-            "time": int(row["timestamp"]),
-            "value": float(row["fee_change_bps"]),
-            "title": f"Fee: {row['final_fee_bps']:.0f} bps ({row['fee_change_bps']:+.0f})",
-        }
-        for _, row in viz_df.iterrows()
-    ]
-
-    # Prepare volume data (line chart)
-    # Include current fee for context
-    volume_data = [
-        {
-            "time": int(row["timestamp"]),
-            "value": float(row["volume_usd"]),
-            "title": f"Volume: ${row['volume_usd']:,.0f} | Fee: {row['final_fee_bps']:.0f} bps",
-        }
-        for _, row in viz_df.iterrows()
-    ]
-
-    # Chart configuration
-    chart_options = {
-        "layout": {
-            "textColor": "black",
-            "background": {"type": "solid", "color": "white"},
-        },
-        "rightPriceScale": {
-            "visible": True,
-        },
-        "leftPriceScale": {
-            "visible": True,
-        },
-        "timeScale": {
-            "timeVisible": True,
-            "secondsVisible": False,
-        },
-    }
+    fee_change_data, volume_data = _fee_overlay_points(df, "volume_usd", "Volume", max_points)
 
     # Series configuration
     # Histogram for fee changes (bars with tooltips showing current fee)
     # Line for volume
     series = [
-        {
-            "type": "Histogram",
-            "data": fee_change_data,
-            "options": {
-                "color": "rgba(255, 107, 53, 0.6)",
-                "priceScaleId": "right",
-                "title": "Δ Fee (bps) - INDEPENDENT VARIABLE",
-            },
-        },
+        _fee_change_series(fee_change_data),
         {
             "type": "Line",
             "data": volume_data,
@@ -187,10 +425,10 @@ def create_fee_volume_lightweight_chart(df: pd.DataFrame) -> list[dict]:
         },
     ]
 
-    return [{"chart": chart_options, "series": series}]
+    return [{"chart": _lightweight_chart_options(), "series": series}]
 
 
-def create_simple_volume_revenue_bars(df: pd.DataFrame) -> go.Figure:
+def create_simple_volume_revenue_bars(df: pd.DataFrame) -> "go.Figure":
     """
     Create a simple, clear bar chart showing volume and revenue side-by-side.
     Follows visualization best practices: clear, direct, easy to interpret.
@@ -201,57 +439,53 @@ def create_simple_volume_revenue_bars(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly Figure with grouped bars
     """
-    viz_df = df.copy()
-    viz_df["period_start_date"] = pd.to_datetime(viz_df["period_start_date"])
-    viz_df["period_label"] = viz_df["period_start_date"].dt.strftime("%b %d")
+    import plotly.graph_objects as go
 
-    # Normalize to same scale for comparison (0-100)
-    max_volume = viz_df["volume_usd"].max()
-    max_revenue = viz_df["fees_usd"].max()
-
-    viz_df["volume_normalized"] = (viz_df["volume_usd"] / max_volume) * 100
-    viz_df["revenue_normalized"] = (viz_df["fees_usd"] / max_revenue) * 100
+    # Extract plotted columns once; all three traces share the x labels and fee tier
+    period_labels = _as_datetime(df["period_start_date"]).dt.strftime("%b %d").to_numpy()
+    volume = df["volume_usd"].to_numpy(dtype=np.float64)
+    revenue = df["fees_usd"].to_numpy(dtype=np.float64)
+    fee_bps = df["final_fee_bps"].to_numpy()
 
-    fig = go.Figure()
+    # Normalize to same scale for comparison (0-100)
+    volume_normalized = _normalize_pct(volume)
+    revenue_normalized = _normalize_pct(revenue)
 
-    # Volume bars
-    fig.add_trace(
+    traces = [
+        # Volume bars
         go.Bar(
             name="Volume",
-            x=viz_df["period_label"],
-            y=viz_df["volume_normalized"],
+            x=period_labels,
+            y=volume_normalized,
             marker_color="#2196F3",
-            customdata=viz_df[["volume_usd", "final_fee_bps"]],
+            customdata=np.column_stack([volume, fee_bps]),
             hovertemplate="<b>Volume</b><br>%{customdata[0]:$,.0f}<br>Fee: %{customdata[1]:.0f} bps<extra></extra>",
-        )
-    )
-
-    # Revenue bars (PRIMARY METRIC)
-    fig.add_trace(
+        ),
+        # Revenue bars (PRIMARY METRIC)
         go.Bar(
             name="Revenue (PRIMARY)",
-            x=viz_df["period_label"],
-            y=viz_df["revenue_normalized"],
+            x=period_labels,
+            y=revenue_normalized,
             marker_color="#2E7D32",
-            customdata=viz_df[["fees_usd", "final_fee_bps"]],
+            customdata=np.column_stack([revenue, fee_bps]),
             hovertemplate="<b>Revenue</b><br>%{customdata[0]:$,.0f}<br>Fee: %{customdata[1]:.0f} bps<extra></extra>",
-        )
-    )
-
-    # Add fee tier as line overlay
-    fig.add_trace(
+        ),
+        # Fee tier as line overlay
         go.Scatter(
             name="Fee Tier",
-            x=viz_df["period_label"],
-            y=viz_df["final_fee_bps"] * 4,  # Scale to fit 0-100 range
+            x=period_labels,
+            y=fee_bps * 4,  # Scale to fit 0-100 range
             mode="lines+markers",
             line=dict(color="#FF6B35", width=3),
             marker=dict(size=10),
             yaxis="y2",
             hovertemplate="<b>Fee Tier</b><br>%{text} bps<extra></extra>",
-            text=viz_df["final_fee_bps"],
-        )
-    )
+            text=fee_bps,
+        ),
+    ]
+    fig = go.Figure(data=traces)
+    # Skip per-bar outline strokes; the fills already separate grouped bars
+    fig.update_traces(marker_line_width=0, selector=dict(type="bar"))
 
     fig.update_layout(
         title="Volume & Revenue Response to Fee Changes (Normalized to 0-100 Scale)",
@@ -268,7 +502,7 @@ def create_simple_volume_revenue_bars(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
-def create_volume_footprint_chart(df: pd.DataFrame) -> go.Figure:
+def create_volume_footprint_chart(df: pd.DataFrame) -> "go.Figure":
     """
     Create a volume footprint chart where:
     - Bar height = volume (USD)
@@ -282,48 +516,57 @@ def create_volume_footprint_chart(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly Figure object
     """
-    viz_df = df.copy()
+    import plotly.graph_objects as go
+
+    viz_df = df[
+        [
+            "period_start_date",
+            "period_id",
+            "volume_usd",
+            "prev_volume_usd",
+            "final_fee_bps",
+            "pct_change_volume",
+        ]
+    ].copy()
     viz_df["volume_delta"] = viz_df["volume_usd"] - viz_df["prev_volume_usd"]
-    viz_df["abs_volume_delta"] = viz_df["volume_delta"].abs()
-    viz_df["period_start_date"] = pd.to_datetime(viz_df["period_start_date"])
-
-    # Calculate bar widths proportional to volume delta
-    max_delta = viz_df["abs_volume_delta"].max()
-    if max_delta > 0:
-        viz_df["bar_width_days"] = (viz_df["abs_volume_delta"] / max_delta) * 5  # Max 5 days
-    else:
-        viz_df["bar_width_days"] = 1
-
-    fig = go.Figure()
-
-    # Add volume bars with varying widths
-    for idx, row in viz_df.iterrows():
-        fig.add_trace(
-            go.Bar(
-                x=[row["period_start_date"]],
-                y=[row["volume_usd"]],
-                width=[row["bar_width_days"] * 24 * 60 * 60 * 1000],  # Convert to milliseconds
-                marker=dict(
-                    color=row["final_fee_bps"],
-                    colorscale="Blues",
-                    cmin=viz_df["final_fee_bps"].min(),
-                    cmax=viz_df["final_fee_bps"].max(),
-                    colorbar=dict(title="Fee (bps)", x=1.02) if idx == 0 else None,
-                    line=dict(color="white", width=1),
-                ),
-                name=f"Period {row['period_id']}",
-                hovertemplate=(
-                    f"<b>Period {row['period_id']}</b><br>"
-                    f"Date: {row['period_start_date'].strftime('%Y-%m-%d')}<br>"
-                    f"Volume: ${row['volume_usd']:,.0f}<br>"
-                    f"Δ Volume: ${row['volume_delta']:+,.0f}<br>"
-                    f"Fee: {row['final_fee_bps']:.1f} bps<br>"
-                    f"Δ Volume %: {row['pct_change_volume']:+.1f}%<br>"
-                    "<extra></extra>"
-                ),
-                showlegend=False,
-            )
+    viz_df["period_start_date"] = _as_datetime(viz_df["period_start_date"])
+
+    # Calculate bar widths proportional to volume delta, in milliseconds (max 5 days)
+    abs_delta = viz_df["volume_delta"].abs()
+    max_delta = abs_delta.max()
+    width_days = (abs_delta / max_delta * 5).to_numpy() if max_delta > 0 else np.ones(len(viz_df))
+    bar_width_ms = width_days * _MS_PER_DAY
+
+    # Single bar trace with per-bar widths/colors; hover values ride along as customdata
+    fig = go.Figure(
+        go.Bar(
+            x=viz_df["period_start_date"],
+            y=viz_df["volume_usd"],
+            width=bar_width_ms,
+            marker=dict(
+                color=viz_df["final_fee_bps"],
+                colorscale="Blues",
+                cmin=viz_df["final_fee_bps"].min(),
+                cmax=viz_df["final_fee_bps"].max(),
+                colorbar=dict(title="Fee (bps)", x=1.02),
+                line=dict(color="white", width=1),
+            ),
+            # Fee is read back from marker.color, so only the remaining fields ride along
+            customdata=np.column_stack(
+                [viz_df["period_id"], viz_df["volume_delta"], viz_df["pct_change_volume"]]
+            ),
+            hovertemplate=(
+                "<b>Period %{customdata[0]}</b><br>"
+                "Date: %{x|%Y-%m-%d}<br>"
+                "Volume: $%{y:,.0f}<br>"
+                "Δ Volume: $%{customdata[1]:+,.0f}<br>"
+                "Fee: %{marker.color:.1f} bps<br>"
+                "Δ Volume %: %{customdata[2]:+.1f}%<br>"
+                "<extra></extra>"
+            ),
+            showlegend=False,
         )
+    )
 
     fig.update_layout(
         title="Volume Footprint: Bar Width ∝ |Δ Volume|, Color = Fee Tier",
@@ -339,7 +582,9 @@ def create_volume_footprint_chart(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
-def create_fee_revenue_dual_axis(df: pd.DataFrame) -> go.Figure:
+def create_fee_revenue_dual_axis(
+    df: pd.DataFrame, max_points: int = MAX_CHART_POINTS
+) -> "go.Figure":
     """
     Create dual-axis chart overlaying fee tier and revenue:
     - Left Y-axis: Fee tier (area + line)
@@ -348,42 +593,50 @@ def create_fee_revenue_dual_axis(df: pd.DataFrame) -> go.Figure:
     Args:
         df: DataFrame with columns: period_start_date, final_fee_bps, fees_usd,
             period_id, pct_change_fees
+        max_points: Downsample longer series to about this many points
 
     Returns:
         Plotly Figure with dual y-axes
     """
-    viz_df = df.copy()
-    viz_df["period_start_date"] = pd.to_datetime(viz_df["period_start_date"])
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    viz_df = df[["period_start_date", "final_fee_bps", "fees_usd"]].copy()
+    viz_df["period_start_date"] = _as_datetime(viz_df["period_start_date"])
+    viz_df = _downsample_periods(viz_df, "fees_usd", max_points)
 
     # Create figure with secondary y-axis
     fig = make_subplots(specs=[[{"secondary_y": True}]])
 
-    # Fee tier as area (left axis)
-    fig.add_trace(
-        go.Scatter(
-            x=viz_df["period_start_date"],
-            y=viz_df["final_fee_bps"],
-            fill="tozeroy",
-            fillcolor="rgba(255, 165, 0, 0.3)",
-            line=dict(color="darkorange", width=2),
-            name="Fee Tier",
-            hovertemplate="<b>Fee Tier</b><br>%{x|%Y-%m-%d}<br>%{y:.1f} bps<extra></extra>",
-        ),
-        secondary_y=False,
-    )
-
-    # Revenue as line with markers (right axis)
-    fig.add_trace(
-        go.Scatter(
-            x=viz_df["period_start_date"],
-            y=viz_df["fees_usd"],
-            mode="lines+markers",
-            line=dict(color="darkgreen", width=3),
-            marker=dict(size=10, color="green"),
-            name="Revenue",
-            hovertemplate=("<b>Revenue</b><br>%{x|%Y-%m-%d}<br>$%{y:,.0f}<br><extra></extra>"),
-        ),
-        secondary_y=True,
+    # SVG is sharper for weekly data; switch to WebGL only when point counts get large
+    scatter = go.Scattergl if len(viz_df) > WEBGL_MIN_POINTS else go.Scatter
+    # Markers only help on short series; on long ones they dominate render time
+    revenue_mode = "lines+markers" if len(viz_df) < MARKER_MAX_POINTS else "lines"
+
+    fig.add_traces(
+        [
+            # Fee tier as area (left axis)
+            scatter(
+                x=viz_df["period_start_date"],
+                y=viz_df["final_fee_bps"],
+                fill="tozeroy",
+                fillcolor="rgba(255, 165, 0, 0.3)",
+                line=dict(color="darkorange", width=2),
+                name="Fee Tier",
+                hovertemplate="<b>Fee Tier</b><br>%{x|%Y-%m-%d}<br>%{y:.1f} bps<extra></extra>",
+            ),
+            # Revenue as line with markers (right axis)
+            scatter(
+                x=viz_df["period_start_date"],
+                y=viz_df["fees_usd"],
+                mode=revenue_mode,
+                line=dict(color="darkgreen", width=3),
+                marker=dict(size=10, color="green"),
+                name="Revenue",
+                hovertemplate="<b>Revenue</b><br>%{x|%Y-%m-%d}<br>$%{y:,.0f}<br><extra></extra>",
+            ),
+        ],
+        secondary_ys=[False, True],
     )
 
     # Update axes
@@ -401,6 +654,7 @@ def create_fee_revenue_dual_axis(df: pd.DataFrame) -> go.Figure:
         hovermode="x unified",
         template="plotly_white",
         legend=dict(x=0.01, y=0.99, bgcolor="rgba(255,255,255,0.8)"),
+        transition={"duration": 0},
     )
 
     return fig
@@ -414,7 +668,7 @@ def create_elasticity_scatter(
     x_label: str,
     y_label: str,
     elasticity_value: float | None = None,
-) -> alt.Chart:
+) -> "alt.Chart":
     """
     Create scatter plot with regression line for elasticity visualization.
 
@@ -430,20 +684,21 @@ def create_elasticity_scatter(
     Returns:
         Altair Chart object
     """
+    import altair as alt
+
     if elasticity_value is not None:
         title = f"{title} (Elasticity = {elasticity_value:.3f})"
 
     # Filter out rows with NaN or infinite values in the columns we need
-    viz_df = df[[x_col, y_col, "final_fee_bps", "period_id"]].copy()
-    viz_df = viz_df.replace([float("inf"), float("-inf")], float("nan"))
-    viz_df = viz_df.dropna()
+    viz_df = _finite_rows(df, [x_col, y_col, "final_fee_bps", "period_id"])
+    point_size = 80 if len(viz_df) > _DENSE_SCATTER_POINTS else 200
 
     # Check if we have enough data points for regression
     if len(viz_df) < 2:
         # Not enough data for regression, just show scatter
         scatter = (
             alt.Chart(viz_df)
-            .mark_circle(size=200)
+            .mark_circle(size=point_size)
             .encode(
                 x=alt.X(f"{x_col}:Q", title=x_label, scale=alt.Scale(zero=False)),
                 y=alt.Y(f"{y_col}:Q", title=y_label, scale=alt.Scale(zero=False)),
@@ -464,7 +719,7 @@ def create_elasticity_scatter(
     # Scatter plot
     scatter = (
         alt.Chart(viz_df)
-        .mark_circle(size=200, opacity=0.8)
+        .mark_circle(size=point_size, opacity=0.8)
         .encode(
             x=alt.X(f"{x_col}:Q", title=x_label, scale=alt.Scale(zero=False)),
             y=alt.Y(f"{y_col}:Q", title=y_label, scale=alt.Scale(zero=False)),
@@ -482,13 +737,8 @@ def create_elasticity_scatter(
 
     # Regression line - create separately to ensure it renders
     regression = (
-        alt.Chart(viz_df)
+        alt.Chart(_regression_line(viz_df, x_col, y_col))
         .mark_line(color="red", strokeDash=[5, 5], strokeWidth=3)
-        .transform_regression(
-            x_col,
-            y_col,
-            method="linear",
-        )
         .encode(
             x=alt.X(f"{x_col}:Q"),
             y=alt.Y(f"{y_col}:Q"),
@@ -507,7 +757,7 @@ def create_elasticity_scatter(
 
 def create_waterfall_chart(
     components: list[dict], title: str = "Revenue Decomposition Waterfall"
-) -> go.Figure:
+) -> "go.Figure":
     """
     Create a waterfall chart for revenue decomposition.
 
@@ -519,11 +769,13 @@ def create_waterfall_chart(
     Returns:
         Plotly Figure object
     """
-    df = pd.DataFrame(components)
+    import plotly.graph_objects as go
 
-    # Prepare waterfall data
+    # Prepare waterfall data in a single pass over the component dicts
     measure = []
     text = []
+    labels = []
+    values = []
     for comp in components:
         if comp["type"] == "total":
             measure.append("total")
@@ -531,16 +783,18 @@ def create_waterfall_chart(
         else:
             measure.append("relative")
             text.append(f"${comp['value']:+,.0f}")
+        labels.append(comp["component"])
+        values.append(comp["value"])
 
     fig = go.Figure(
         go.Waterfall(
             name="Revenue",
             orientation="v",
             measure=measure,
-            x=df["component"],
+            x=labels,
             textposition="outside",
             text=text,
-            y=df["value"],
+            y=values,
             connector={"line": {"color": "rgb(63, 63, 63)"}},
             decreasing={"marker": {"color": "#d62728"}},
             increasing={"marker": {"color": "#2ca02c"}},
@@ -562,7 +816,7 @@ def create_waterfall_chart(
     return fig
 
 
-def create_period_comparison_heatmap(df: pd.DataFrame) -> alt.Chart:
+def create_period_comparison_heatmap(df: pd.DataFrame) -> "alt.Chart":
     """
     Create a heatmap comparing metrics across periods.
 
@@ -572,21 +826,21 @@ def create_period_comparison_heatmap(df: pd.DataFrame) -> alt.Chart:
     Returns:
         Altair Chart object
     """
+    import altair as alt
+
     # Prepare data for heatmap
     metrics = ["pct_change_volume", "pct_change_fees", "pct_change_swaps"]
-    heatmap_data = []
-
-    for metric in metrics:
-        for _, row in df.iterrows():
-            heatmap_data.append(
-                {
-                    "period": f"P{row['period_id']}",
-                    "metric": metric.replace("pct_change_", "Δ ").replace("_", " ").title(),
-                    "value": row[metric],
-                }
-            )
+    metric_labels = {m: m.replace("pct_change_", "Δ ").replace("_", " ").title() for m in metrics}
 
-    heatmap_df = pd.DataFrame(heatmap_data)
+    # Reshape to long format (one row per period-metric cell)
+    heatmap_df = df.melt(id_vars="period_id", value_vars=metrics, var_name="metric")
+    heatmap_df = pd.DataFrame(
+        {
+            "period": "P" + heatmap_df["period_id"].astype(str),
+            "metric": heatmap_df["metric"].map(metric_labels),
+            "value": heatmap_df["value"],
+        }
+    )
 
     chart = (
         alt.Chart(heatmap_df)
@@ -611,7 +865,7 @@ def create_period_comparison_heatmap(df: pd.DataFrame) -> alt.Chart:
     return chart
 
 
-def create_pool_revenue_treemap(df: pd.DataFrame, pool_type_col: str = "pool_type") -> go.Figure:
+def create_pool_revenue_treemap(df: pd.DataFrame, pool_type_col: str = "pool_type") -> "go.Figure":
     """
     Create a treemap showing pool revenue distribution colored by pool type.
 
@@ -621,7 +875,15 @@ def create_pool_revenue_treemap(df: pd.DataFrame, pool_type_col: str = "pool_typ
 
     Returns:
         Plotly Figure object
+
+    Raises:
+        ValueError: If df is empty
     """
+    if df.empty:
+        raise ValueError("No pool data to chart")
+
+    import plotly.express as px
+
     # Aggregate by pool across ALL periods
     pool_totals = df.groupby(["pool_name", pool_type_col]).agg({"fees_usd": "sum"}).reset_index()
 
@@ -651,7 +913,7 @@ def create_pool_revenue_treemap(df: pd.DataFrame, pool_type_col: str = "pool_typ
 
 def create_pool_small_multiples(
     df: pd.DataFrame, top_n: int = 6, metric: str = "fees_usd"
-) -> alt.Chart:
+) -> "alt.Chart":
     """
     Create small multiples showing metric trends for top N pools.
 
@@ -662,15 +924,23 @@ def create_pool_small_multiples(
 
     Returns:
         Altair Chart object with faceted subplots
+
+    Raises:
+        ValueError: If df is empty
     """
-    viz_df = df.copy()
+    if df.empty:
+        raise ValueError("No pool data to chart")
+
+    import altair as alt
 
     # Get top N pools by total metric
-    top_pools = viz_df.groupby("pool_name")[metric].sum().nlargest(top_n).index.tolist()
+    top_pools = _top_pools(df, metric, top_n)
 
-    # Filter to top pools
-    viz_df = viz_df[viz_df["pool_name"].isin(top_pools)].copy()
-    viz_df["period_start_date"] = pd.to_datetime(viz_df["period_start_date"])
+    # Filter to top pools, keeping only the plotted columns
+    viz_df = df.loc[
+        df["pool_name"].isin(top_pools), ["pool_name", "period_start_date", metric, "final_fee_bps"]
+    ].copy()
+    viz_df["period_start_date"] = _as_datetime(viz_df["period_start_date"])
 
     # Create small multiples
     chart = (
@@ -705,7 +975,9 @@ def create_pool_small_multiples(
     return chart
 
 
-def create_pool_elasticity_heatmap(df: pd.DataFrame, metric: str = "pct_change_fees") -> alt.Chart:
+def create_pool_elasticity_heatmap(
+    df: pd.DataFrame, metric: str = "pct_change_fees"
+) -> "alt.Chart":
     """
     Create a heatmap showing pool elasticity across fee tiers.
 
@@ -715,16 +987,23 @@ def create_pool_elasticity_heatmap(df: pd.DataFrame, metric: str = "pct_change_f
 
     Returns:
         Altair Chart object
+
+    Raises:
+        ValueError: If df is empty
     """
-    viz_df = df.copy()
+    if df.empty:
+        raise ValueError("No pool data to chart")
 
-    # Aggregate by pool and fee tier
-    heatmap_data = viz_df.groupby(["pool_name", "final_fee_bps"])[metric].mean().reset_index()
+    import altair as alt
+
+    # Restrict to top 15 pools by total activity before aggregating the rest of the frame
+    if "fees_usd" in df.columns:
+        df = df[df["pool_name"].isin(_top_pools(df, "fees_usd", 15))]
 
-    # Get top 15 pools by total activity
-    if "fees_usd" in viz_df.columns:
-        top_pools = viz_df.groupby("pool_name")["fees_usd"].sum().nlargest(15).index.tolist()
-        heatmap_data = heatmap_data[heatmap_data["pool_name"].isin(top_pools)]
+    # Aggregate by pool and fee tier
+    heatmap_data = (
+        df.groupby(["pool_name", "final_fee_bps"], observed=True)[metric].mean().reset_index()
+    )
 
     chart = (
         alt.Chart(heatmap_data)
@@ -768,7 +1047,7 @@ def create_pool_elasticity_scatter(
     x_col: str = "pct_change_fee_bps",
     y_col: str = "pct_change_volume",
     color_by: str = "pool_type",
-) -> alt.Chart:
+) -> "alt.Chart":
     """
     Create scatter plot showing pool-level elasticity with pool type coloring.
 
@@ -781,9 +1060,9 @@ def create_pool_elasticity_scatter(
     Returns:
         Altair Chart object
     """
-    viz_df = df[[x_col, y_col, color_by, "pool_name", "period_id", "final_fee_bps"]].copy()
-    viz_df = viz_df.replace([float("inf"), float("-inf")], float("nan"))
-    viz_df = viz_df.dropna()
+    import altair as alt
+
+    viz_df = _finite_rows(df, [x_col, y_col, color_by, "pool_name", "period_id", "final_fee_bps"])
 
     if len(viz_df) < 2:
         # Not enough data
@@ -831,9 +1110,8 @@ def create_pool_elasticity_scatter(
 
     # Regression line
     regression = (
-        alt.Chart(viz_df)
+        alt.Chart(_regression_line(viz_df, x_col, y_col))
         .mark_line(color="red", strokeDash=[5, 5], strokeWidth=2)
-        .transform_regression(x_col, y_col, method="linear")
         .encode(
             x=alt.X(f"{x_col}:Q"),
             y=alt.Y(f"{y_col}:Q"),
@@ -849,7 +1127,9 @@ def create_pool_elasticity_scatter(
     return chart
 
 
-def create_pool_market_share_area(df: pd.DataFrame, pool_type_col: str = "pool_type") -> alt.Chart:
+def create_pool_market_share_area(
+    df: pd.DataFrame, pool_type_col: str = "pool_type"
+) -> "alt.Chart":
     """
     Create stacked area chart showing pool market share evolution over time.
 
@@ -859,17 +1139,24 @@ def create_pool_market_share_area(df: pd.DataFrame, pool_type_col: str = "pool_t
 
     Returns:
         Altair Chart object
+
+    Raises:
+        ValueError: If df is empty
     """
-    viz_df = df.copy()
-    viz_df["period_start_date"] = pd.to_datetime(viz_df["period_start_date"])
+    if df.empty:
+        raise ValueError("No pool data to chart")
+
+    import altair as alt
+
+    viz_df = df[["period_start_date", "pool_name", pool_type_col, "pct_of_period_volume"]].copy()
+    viz_df["period_start_date"] = _as_datetime(viz_df["period_start_date"])
 
     # Get top 10 pools by average share
-    top_pools = (
-        viz_df.groupby("pool_name")["pct_of_period_volume"].mean().nlargest(10).index.tolist()
-    )
+    top_pools = _top_pools(viz_df, "pct_of_period_volume", 10, how="mean")
 
     # Filter and aggregate others
-    viz_df["pool_display"] = viz_df["pool_name"].apply(lambda x: x if x in top_pools else "Other")
+    is_top = viz_df["pool_name"].isin(top_pools).to_numpy()
+    viz_df["pool_display"] = np.where(is_top, viz_df["pool_name"].to_numpy(dtype=object), "Other")
 
     agg_df = (
         viz_df.groupby(["period_start_date", "pool_display", pool_type_col])
@@ -1,5 +1,6 @@
 """Tests for revenue decomposition module."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -12,7 +13,7 @@ from thorchain_fee_analysis.analysis.revenue_decomposition import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_period_data():
     """Create sample period data for decomposition testing."""
     prev_period = {
@@ -38,12 +39,14 @@ def sample_period_data():
     return prev_period, current_period
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_decomposition_data():
-    """Create sample DataFrame for decomposition analysis."""
+    """Create sample decomposition DataFrame (shared per module; tests must not mutate it)."""
     data = {
         "period_id": [1, 2, 3, 4],
-        "period_start_date": pd.date_range("2025-08-15", periods=4, freq="7D"),
+        "period_start_date": np.array(
+            ["2025-08-15", "2025-08-22", "2025-08-29", "2025-09-05"], dtype="datetime64[ns]"
+        ),
         "final_fee_bps": [10.0, 25.0, 10.0, 15.0],
         "volume_usd": [1000000, 800000, 950000, 900000],
         "fees_usd": [1000, 2000, 950, 1350],
@@ -53,6 +56,12 @@ def sample_decomposition_data():
     return pd.DataFrame(data)
 
 
+@pytest.fixture(scope="module")
+def decomp_results(sample_decomposition_data):
+    """Decompose the sample data once for tests that consume the results."""
+    return analyze_revenue_decomposition(sample_decomposition_data)
+
+
 def test_decompose_revenue_change(sample_period_data):
     """Test basic revenue decomposition."""
     prev_period, current_period = sample_period_data
@@ -67,14 +76,14 @@ def test_decompose_revenue_change(sample_period_data):
     assert result.total_revenue_change == 1000.0  # 2000 - 1000
 
     # Check that components sum to total (approximately)
-    components_sum = (
-        result.fee_rate_effect + result.volume_effect + result.mix_effect + result.external_effect
+    effects = np.array(
+        [result.fee_rate_effect, result.volume_effect, result.mix_effect, result.external_effect]
     )
-    assert abs(components_sum - result.total_revenue_change) < 0.01
+    np.testing.assert_allclose(effects.sum(), result.total_revenue_change, atol=0.01)
 
     # Check percentages sum to 100 (approximately)
-    pct_sum = result.fee_rate_pct + result.volume_pct + result.mix_pct + result.external_pct
-    assert abs(pct_sum - 100.0) < 0.1
+    pcts = np.array([result.fee_rate_pct, result.volume_pct, result.mix_pct, result.external_pct])
+    np.testing.assert_allclose(pcts.sum(), 100.0, atol=0.1)
 
 
 def test_decompose_revenue_change_fee_effect(sample_period_data):
@@ -86,7 +95,7 @@ def test_decompose_revenue_change_fee_effect(sample_period_data):
     # Fee rate effect = (new_fee - old_fee) * old_volume
     # = (0.0025 - 0.0010) * 1000000 = 1500
     expected_fee_effect = (0.0025 - 0.0010) * 1000000
-    assert abs(result.fee_rate_effect - expected_fee_effect) < 1.0
+    np.testing.assert_allclose(result.fee_rate_effect, expected_fee_effect, atol=1.0)
 
 
 def test_decompose_revenue_change_volume_effect(sample_period_data):
@@ -98,7 +107,7 @@ def test_decompose_revenue_change_volume_effect(sample_period_data):
     # Volume effect = old_fee * (new_volume - old_volume)
     # = 0.0010 * (800000 - 1000000) = -200
     expected_volume_effect = 0.0010 * (800000 - 1000000)
-    assert abs(result.volume_effect - expected_volume_effect) < 1.0
+    np.testing.assert_allclose(result.volume_effect, expected_volume_effect, atol=1.0)
 
 
 def test_decompose_revenue_change_zero_change():
@@ -139,13 +148,10 @@ def test_analyze_revenue_decomposition(sample_decomposition_data):
     assert len(results) == 3
 
     # All results should be DecompositionResult instances
-    for result in results:
-        assert isinstance(result, DecompositionResult)
+    assert all(isinstance(result, DecompositionResult) for result in results)
 
     # Period IDs should be sequential starting from 2
-    assert results[0].period_id == 2
-    assert results[1].period_id == 3
-    assert results[2].period_id == 4
+    assert [result.period_id for result in results] == [2, 3, 4]
 
 
 def test_analyze_revenue_decomposition_single_period():
@@ -168,9 +174,8 @@ def test_analyze_revenue_decomposition_single_period():
     assert len(results) == 0
 
 
-def test_create_waterfall_data(sample_decomposition_data):
+def test_create_waterfall_data(decomp_results):
     """Test waterfall data creation."""
-    decomp_results = analyze_revenue_decomposition(sample_decomposition_data)
     waterfall_df = create_waterfall_data(decomp_results)
 
     # Check DataFrame structure
@@ -206,9 +211,8 @@ def test_create_waterfall_data_empty():
     assert len(waterfall_df) == 0
 
 
-def test_summarize_decomposition(sample_decomposition_data):
+def test_summarize_decomposition(decomp_results):
     """Test decomposition summary statistics."""
-    decomp_results = analyze_revenue_decomposition(sample_decomposition_data)
     summary = summarize_decomposition(decomp_results)
 
     # Check summary structure
@@ -252,24 +256,20 @@ def test_summarize_decomposition_empty():
 
 def test_decomposition_with_polars():
     """Test decomposition with Polars DataFrame."""
-    try:
-        import polars as pl
-
-        data = {
-            "period_id": [1, 2, 3],
-            "period_start_date": ["2025-08-15", "2025-08-22", "2025-08-29"],
-            "final_fee_bps": [10.0, 25.0, 10.0],
-            "volume_usd": [1000000, 800000, 950000],
-            "fees_usd": [1000, 2000, 950],
-            "swaps_count": [1000, 900, 950],
-            "avg_swap_size_usd": [1000, 889, 1000],
-        }
-        df = pl.DataFrame(data)
+    pl = pytest.importorskip("polars", reason="Polars not installed")
 
-        results = analyze_revenue_decomposition(df)
+    data = {
+        "period_id": [1, 2, 3],
+        "period_start_date": ["2025-08-15", "2025-08-22", "2025-08-29"],
+        "final_fee_bps": [10.0, 25.0, 10.0],
+        "volume_usd": [1000000, 800000, 950000],
+        "fees_usd": [1000, 2000, 950],
+        "swaps_count": [1000, 900, 950],
+        "avg_swap_size_usd": [1000, 889, 1000],
+    }
+    df = pl.DataFrame(data)
 
-        assert len(results) == 2
-        assert all(isinstance(r, DecompositionResult) for r in results)
+    results = analyze_revenue_decomposition(df)
 
-    except ImportError:
-        pytest.skip("Polars not installed")
+    assert len(results) == 2
+    assert all(isinstance(r, DecompositionResult) for r in results)
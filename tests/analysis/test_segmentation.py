@@ -0,0 +1,140 @@
+"""Tests for trade-size segmentation module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from thorchain_fee_analysis.analysis.segmentation import (
+    add_elasticity_to_metrics,
+    assign_trade_size_segment,
+    compute_segment_metrics,
+    estimate_segment_elasticity,
+)
+
+
+@pytest.fixture
+def sample_user_period_data():
+    """Create sample user-period data spanning four periods."""
+    fee_by_period = {1: 10.0, 2: 25.0, 3: 10.0, 4: 15.0}
+    rows = []
+    for period_id, fee_bps in fee_by_period.items():
+        for i, volume in enumerate([50.0, 500.0, 5000.0, 50000.0, 500000.0]):
+            # User "u4" (whale-sized) drops out after period 2
+            if i == 4 and period_id > 2:
+                continue
+            rows.append(
+                {
+                    "period_id": period_id,
+                    "period_start_date": pd.Timestamp("2025-08-15")
+                    + pd.Timedelta(days=7 * (period_id - 1)),
+                    "final_fee_bps": fee_bps,
+                    "user_address": f"u{i}",
+                    "swaps_count": i + 1,
+                    "volume_usd": volume * (1 + 0.1 * period_id),
+                    "fees_usd": volume * (1 + 0.1 * period_id) * fee_bps / 10000,
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def test_assign_trade_size_segment(sample_user_period_data):
+    """Test that users are bucketed by volume thresholds."""
+    df = assign_trade_size_segment(sample_user_period_data)
+
+    first_period = df[df["period_id"] == 1].set_index("user_address")["segment"]
+    assert first_period.to_dict() == {
+        "u0": "micro",
+        "u1": "small",
+        "u2": "medium",
+        "u3": "large",
+        "u4": "whale",
+    }
+
+
+def test_compute_segment_metrics(sample_user_period_data):
+    """Test segment aggregation and retention."""
+    user_df = assign_trade_size_segment(sample_user_period_data)
+    metrics = compute_segment_metrics(user_df)
+
+    # One row per period-segment combination present in the data
+    assert len(metrics) == len(user_df.groupby(["period_id", "segment"]))
+    assert (metrics["user_count"] == 1).all()
+    assert np.allclose(metrics["avg_fees_paid_usd"], metrics["fees_usd"])
+
+    whale = metrics[metrics["segment"] == "whale"].set_index("period_id")
+    assert whale.loc[1, "retention_rate"] == 1.0
+    assert whale.loc[2, "retention_rate"] == 0.0
+
+
+def test_compute_segment_metrics_categorical_segments(sample_user_period_data):
+    """Test that categorical segments only produce observed period-segment rows."""
+    user_df = assign_trade_size_segment(sample_user_period_data)
+    categorical_df = user_df.assign(segment=user_df["segment"].astype("category"))
+
+    metrics = compute_segment_metrics(categorical_df)
+    expected = compute_segment_metrics(user_df)
+
+    assert len(metrics) == len(expected)
+    assert np.allclose(metrics["volume_usd"], expected["volume_usd"])
+
+
+def test_compute_segment_metrics_with_weekly_totals(sample_user_period_data):
+    """Test share calculations against weekly totals."""
+    user_df = assign_trade_size_segment(sample_user_period_data)
+    weekly_df = user_df.groupby("period_id")[["volume_usd", "fees_usd"]].sum().reset_index()
+
+    metrics = compute_segment_metrics(user_df, weekly_df)
+
+    share_sums = metrics.groupby("period_id")[["volume_share", "fees_share"]].sum()
+    assert np.allclose(share_sums, 1.0)
+
+
+def test_compute_segment_metrics_empty_input(sample_user_period_data):
+    """Test that an empty user frame yields an empty metrics frame instead of raising."""
+    empty_df = assign_trade_size_segment(sample_user_period_data).iloc[:0]
+
+    metrics = compute_segment_metrics(empty_df)
+
+    assert metrics.empty
+    assert {"user_count", "avg_fees_paid_usd", "retention_rate"} <= set(metrics.columns)
+
+
+def test_estimate_segment_elasticity(sample_user_period_data):
+    """Test per-segment elasticity estimation."""
+    metrics = compute_segment_metrics(assign_trade_size_segment(sample_user_period_data))
+
+    elasticity_df = estimate_segment_elasticity(metrics)
+
+    assert elasticity_df["segment"].tolist() == ["large", "medium", "micro", "small", "whale"]
+    fitted = elasticity_df[elasticity_df["segment"] != "whale"]
+    assert fitted["elasticity"].notna().all()
+    assert (fitted["n_obs"] == 4).all()
+
+    # Only two whale periods: too few observations to fit
+    whale = elasticity_df[elasticity_df["segment"] == "whale"].iloc[0]
+    assert np.isnan(whale["elasticity"])
+    assert whale["n_obs"] == 2
+
+
+def test_estimate_segment_elasticity_constant_fee(sample_user_period_data):
+    """Test that a segment with no fee variation returns NaN instead of a fit."""
+    user_df = assign_trade_size_segment(sample_user_period_data.assign(final_fee_bps=10.0))
+    metrics = compute_segment_metrics(user_df)
+
+    elasticity_df = estimate_segment_elasticity(metrics)
+
+    fitted = elasticity_df[elasticity_df["segment"] != "whale"]
+    assert fitted["elasticity"].isna().all()
+    assert (fitted["error"] == "Rank-deficient design matrix").all()
+
+
+def test_add_elasticity_to_metrics(sample_user_period_data):
+    """Test attaching elasticity estimates to segment metrics."""
+    metrics = compute_segment_metrics(assign_trade_size_segment(sample_user_period_data))
+    elasticity_df = estimate_segment_elasticity(metrics)
+
+    result = add_elasticity_to_metrics(metrics, elasticity_df)
+
+    assert len(result) == len(metrics)
+    expected = metrics["segment"].map(elasticity_df.set_index("segment")["elasticity"])
+    assert np.allclose(result["elasticity"], expected, equal_nan=True)
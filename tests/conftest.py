@@ -1,10 +1,14 @@
 """Pytest configuration and shared fixtures."""
 
+from pathlib import Path
 from unittest.mock import Mock
 
+import pandas as pd
 import pytest
 from snowflake.snowpark import Session
 
+from thorchain_fee_analysis.data.snowflake_conn import get_snowpark_session
+
 
 @pytest.fixture
 def mock_snowpark_session():
@@ -14,15 +18,42 @@ def mock_snowpark_session():
 
 
 @pytest.fixture
+def no_connections_toml(monkeypatch, tmp_path):
+    """Point Path.home() at an empty directory so no connections.toml is found."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+
+@pytest.fixture(scope="session")
+def shared_snowpark_session():
+    """Open one real Snowpark session for all integration tests in the run.
+
+    Integration tests are deselected by default; run them with ``-m integration``.
+    Skips dependent tests when no connection is configured or the login fails.
+    """
+    from snowflake.connector.errors import Error as SnowflakeError
+
+    try:
+        session = get_snowpark_session(use_streamlit_secrets=False)
+    except RuntimeError:
+        pytest.skip("No Snowflake connection configured")
+    except SnowflakeError as e:
+        pytest.skip(f"Snowflake login failed: {e}")
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
 def sample_weekly_data():
-    """Sample weekly summary data for testing."""
-    return {
-        "period_id": ["P1", "P2"],
-        "period_start_date": ["2025-01-01", "2025-01-08"],
-        "period_end_date": ["2025-01-07", "2025-01-14"],
-        "final_fee_bps": [10.0, 15.0],
-        "volume_usd": [1000000.0, 1200000.0],
-        "fees_usd": [1000.0, 1800.0],
-        "swaps_count": [100, 120],
-        "unique_swappers": [50, 60],
-    }
+    """Sample weekly summary DataFrame for testing (shared per session; do not mutate)."""
+    return pd.DataFrame(
+        {
+            "period_id": ["P1", "P2"],
+            "period_start_date": ["2025-01-01", "2025-01-08"],
+            "period_end_date": ["2025-01-07", "2025-01-14"],
+            "final_fee_bps": [10.0, 15.0],
+            "volume_usd": [1000000.0, 1200000.0],
+            "fees_usd": [1000.0, 1800.0],
+            "swaps_count": [100, 120],
+            "unique_swappers": [50, 60],
+        }
+    )
@@ -1,12 +1,12 @@
 """Example test file demonstrating testing patterns."""
 
-import pandas as pd
+import numpy as np
 import pytest
 
 
 def test_sample_data_fixture(sample_weekly_data):
     """Test that sample data fixture is properly structured."""
-    df = pd.DataFrame(sample_weekly_data)
+    df = sample_weekly_data
 
     # Check structure
     assert len(df) == 2
@@ -15,21 +15,21 @@ def test_sample_data_fixture(sample_weekly_data):
     assert "volume_usd" in df.columns
 
     # Check data types
-    assert df["final_fee_bps"].dtype in [float, "float64"]
-    assert df["volume_usd"].dtype in [float, "float64"]
-    assert df["swaps_count"].dtype in [int, "int64"]
+    assert df["final_fee_bps"].dtype == np.float64
+    assert df["volume_usd"].dtype == np.float64
+    assert df["swaps_count"].dtype == np.int64
 
 
 def test_basic_calculations(sample_weekly_data):
     """Test basic revenue calculations on sample data."""
-    df = pd.DataFrame(sample_weekly_data)
+    df = sample_weekly_data
 
-    # Calculate revenue per swap
-    df["revenue_per_swap"] = df["fees_usd"] / df["swaps_count"]
+    # Calculate revenue per swap without adding a column to the shared fixture
+    revenue_per_swap = df["fees_usd"].to_numpy() / df["swaps_count"].to_numpy()
 
     # Verify calculations
-    assert df["revenue_per_swap"].iloc[0] == 10.0  # 1000 / 100
-    assert df["revenue_per_swap"].iloc[1] == 15.0  # 1800 / 120
+    assert revenue_per_swap[0] == 10.0  # 1000 / 100
+    assert revenue_per_swap[1] == 15.0  # 1800 / 120
 
 
 @pytest.mark.parametrize(
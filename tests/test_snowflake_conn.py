@@ -1,6 +1,8 @@
 """Tests for Snowflake connection utilities."""
 
 import os
+import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -15,14 +17,10 @@ from thorchain_fee_analysis.data.snowflake_conn import (
 class TestGetSnowparkSession:
     """Tests for get_snowpark_session function."""
 
-    @patch("thorchain_fee_analysis.data.snowflake_conn.Path")
+    @pytest.mark.usefixtures("no_connections_toml")
     @patch("thorchain_fee_analysis.data.snowflake_conn.Session")
-    def test_connection_with_env_vars(self, mock_session_class, mock_path):
+    def test_connection_with_env_vars(self, mock_session_class):
         """Test connection using environment variables."""
-        # Mock Path.exists() to return False (no connections.toml file)
-        mock_path.home.return_value = MagicMock()
-        mock_path.home.return_value.__truediv__.return_value.__truediv__.return_value.exists.return_value = False
-
         # Set up environment variables
         env_vars = {
             "SNOWFLAKE_ACCOUNT": "test_account",
@@ -45,17 +43,50 @@ class TestGetSnowparkSession:
             mock_builder.configs.assert_called_once()
             mock_builder.create.assert_called_once()
 
-    @patch("thorchain_fee_analysis.data.snowflake_conn.Path")
-    def test_missing_credentials_raises_error(self, mock_path):
+    @pytest.mark.usefixtures("no_connections_toml")
+    def test_missing_credentials_raises_error(self):
         """Test that missing credentials raises RuntimeError."""
-        # Mock Path.exists() to return False (no connections.toml file)
-        mock_path.home.return_value = MagicMock()
-        mock_path.home.return_value.__truediv__.return_value.__truediv__.return_value.exists.return_value = False
-
         with patch.dict(os.environ, {}, clear=True):
             with pytest.raises(RuntimeError, match="Could not establish Snowflake connection"):
                 get_snowpark_session(use_streamlit_secrets=False)
 
+    @pytest.mark.usefixtures("no_connections_toml")
+    @patch("thorchain_fee_analysis.data.snowflake_conn.Session")
+    def test_streamlit_secrets_skipped_when_not_loaded(self, mock_session_class):
+        """Test that streamlit is not imported outside a Streamlit process."""
+        env_vars = {
+            "SNOWFLAKE_ACCOUNT": "test_account",
+            "SNOWFLAKE_USER": "test_user",
+            "SNOWFLAKE_PASSWORD": "test_password",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True), patch.dict(sys.modules):
+            sys.modules.pop("streamlit", None)
+            mock_builder = MagicMock()
+            mock_session_class.builder = mock_builder
+            mock_builder.configs.return_value = mock_builder
+
+            get_snowpark_session(use_streamlit_secrets=True)
+
+            assert "streamlit" not in sys.modules
+            assert mock_builder.configs.call_args[0][0]["account"] == "test_account"
+
+    @patch("thorchain_fee_analysis.data.snowflake_conn.Session")
+    def test_streamlit_secrets_used_when_loaded(self, mock_session_class):
+        """Test that Streamlit secrets are used when streamlit is already imported."""
+        fake_streamlit = SimpleNamespace(secrets=MagicMock())
+        fake_streamlit.secrets.__contains__.return_value = True
+        fake_streamlit.secrets.snowflake.account = "st_account"
+
+        with patch.dict(sys.modules, {"streamlit": fake_streamlit}):
+            mock_builder = MagicMock()
+            mock_session_class.builder = mock_builder
+            mock_builder.configs.return_value = mock_builder
+
+            get_snowpark_session(use_streamlit_secrets=True)
+
+            assert mock_builder.configs.call_args[0][0]["account"] == "st_account"
+
 
 class TestGetSessionInfo:
     """Tests for get_session_info function."""
@@ -102,3 +133,19 @@ class TestTestConnection:
 
         # Verify
         assert result is False
+
+
+@pytest.mark.integration
+class TestLiveConnection:
+    """Integration tests against a real Snowflake session (skipped when unconfigured)."""
+
+    def test_connection_is_live(self, shared_snowpark_session):
+        """Test that the shared session answers a trivial query."""
+        assert test_connection(shared_snowpark_session) is True
+
+    def test_session_info_is_populated(self, shared_snowpark_session):
+        """Test that session info comes back for the shared session."""
+        info = get_session_info(shared_snowpark_session)
+
+        assert set(info) == {"user", "role", "database"}
+        assert info["user"]
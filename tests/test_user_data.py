@@ -0,0 +1,111 @@
+"""Tests for user-level data loading utilities."""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from thorchain_fee_analysis.analysis.segmentation import assign_trade_size_segment
+from thorchain_fee_analysis.data.user_data import (
+    load_segment_metrics,
+    load_user_period_detail,
+    load_weekly_summary,
+)
+
+
+class TestLoadUserPeriodDetail:
+    """Tests for load_user_period_detail function."""
+
+    def test_numeric_columns_are_narrowed(self, mock_snowpark_session):
+        """Test that counts are downcast to ints and fee amounts to float32."""
+        table = pa.table(
+            {
+                "PERIOD_ID": [1, 2],
+                "USER_ADDRESS": ["thor1a", "thor1b"],
+                "FINAL_FEE_BPS": [10.0, 25.0],
+                "SWAPS_COUNT": [3, 40000],
+                "VOLUME_USD": [1500.25, 20.5],
+                "FEES_USD": [1.5, 0.05],
+            }
+        )
+        mock_snowpark_session.sql.return_value.to_arrow.return_value = table
+
+        df = load_user_period_detail(mock_snowpark_session)
+
+        assert df["period_id"].dtype == np.int8
+        assert df["final_fee_bps"].dtype == np.int8
+        assert df["swaps_count"].dtype == np.int32
+        assert df["volume_usd"].dtype == np.float64
+        assert df["fees_usd"].dtype == np.float32
+        assert df["swaps_count"].tolist() == [3, 40000]
+
+    def test_volume_keeps_segment_boundaries(self, mock_snowpark_session):
+        """Test that volumes just below a threshold stay in the lower segment."""
+        table = pa.table(
+            {
+                "PERIOD_ID": [1, 1],
+                "USER_ADDRESS": ["thor1a", "thor1b"],
+                "VOLUME_USD": [999.99997, 99999.999],
+            }
+        )
+        mock_snowpark_session.sql.return_value.to_arrow.return_value = table
+
+        df = assign_trade_size_segment(load_user_period_detail(mock_snowpark_session))
+
+        assert df["segment"].tolist() == ["small", "large"]
+
+
+class TestLoadWeeklySummary:
+    """Tests for load_weekly_summary function."""
+
+    def test_columns_are_lowercased(self, mock_snowpark_session):
+        """Test that uppercase Snowflake identifiers come back lowercase."""
+        table = pa.table(
+            {
+                "PERIOD_ID": [1, 2],
+                "PERIOD_START_DATE": ["2025-08-15", "2025-08-22"],
+                "VOLUME_USD": [1000000.0, 800000.0],
+            }
+        )
+        mock_snowpark_session.sql.return_value.to_arrow.return_value = table
+
+        df = load_weekly_summary(mock_snowpark_session)
+
+        assert list(df.columns) == ["period_id", "period_start_date", "volume_usd"]
+        assert len(df) == 2
+        mock_snowpark_session.sql.assert_called_once()
+
+    def test_falls_back_to_pandas_without_to_arrow(self, mock_snowpark_session):
+        """Test that Snowpark releases without DataFrame.to_arrow still load."""
+        snowpark_df = Mock(spec=["to_pandas"])
+        snowpark_df.to_pandas.return_value = pd.DataFrame(
+            {"PERIOD_ID": [1, 2], "VOLUME_USD": [1000000.0, 800000.0]}
+        )
+        mock_snowpark_session.sql.return_value = snowpark_df
+
+        df = load_weekly_summary(mock_snowpark_session)
+
+        assert list(df.columns) == ["period_id", "volume_usd"]
+        assert df["volume_usd"].tolist() == [1000000.0, 800000.0]
+
+
+class TestLoadSegmentMetrics:
+    """Tests for load_segment_metrics function."""
+
+    def test_aggregates_in_sql_with_custom_thresholds(self, mock_snowpark_session):
+        """Test that segment thresholds and derived metrics are pushed into SQL."""
+        table = pa.table({"PERIOD_ID": [1], "SEGMENT": ["retail"], "AVG_FEES_PAID_USD": [2.5]})
+        mock_snowpark_session.sql.return_value.to_arrow.return_value = table
+
+        df = load_segment_metrics(
+            mock_snowpark_session,
+            thresholds={"retail": (0, 500), "pro": (500, float("inf"))},
+        )
+
+        sql = mock_snowpark_session.sql.call_args[0][0]
+        assert "THEN 'retail'" in sql
+        assert "WHEN volume_usd >= 500 THEN 'pro'" in sql
+        assert "AS avg_fees_paid_usd" in sql
+        assert "PARTITION BY period_id" in sql
+        assert list(df.columns) == ["period_id", "segment", "avg_fees_paid_usd"]
@@ -0,0 +1,21 @@
+"""Tests for the Phase 4 view validation script."""
+
+import copy
+
+from validate_phase4_views import DRY_RUN_RESULTS, dry_run_connection, run_qa
+
+
+def test_run_qa_passes_on_clean_results():
+    """Test that synthetic passing results clear every QA check."""
+    conn = dry_run_connection()
+
+    assert run_qa(conn) is True
+    conn.cursor.return_value.execute.assert_called_once()
+
+
+def test_run_qa_fails_on_duplicates():
+    """Test that duplicate rows in a view fail the QA run."""
+    results = copy.deepcopy(DRY_RUN_RESULTS)
+    results[1] = [("V_POOL_WEEKLY_SUMMARY", 3), ("FCT_POOL_ELASTICITY_INPUTS", 0)]
+
+    assert run_qa(dry_run_connection(results)) is False
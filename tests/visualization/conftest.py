@@ -0,0 +1,68 @@
+"""Shared fixtures for chart builder tests."""
+
+import pandas as pd
+import pytest
+
+from src.thorchain_fee_analysis.visualization.charts import (
+    create_fee_revenue_dual_axis,
+    create_fee_revenue_lightweight_chart,
+    create_fee_volume_lightweight_chart,
+    create_volume_footprint_chart,
+)
+
+
+@pytest.fixture(scope="session")
+def sample_elasticity_data():
+    """Sample elasticity data for chart tests (shared per session; do not mutate)."""
+    data = {
+        "period_id": [1, 2, 3, 4, 5],
+        "period_start_date": pd.to_datetime(
+            ["2023-01-01", "2023-01-08", "2023-01-15", "2023-01-22", "2023-01-29"]
+        ),
+        "period_end_date": pd.to_datetime(
+            ["2023-01-07", "2023-01-14", "2023-01-21", "2023-01-28", "2023-02-04"]
+        ),
+        "final_fee_bps": [10.0, 15.0, 12.0, 20.0, 10.0],
+        "prev_fee_bps": [10.0, 10.0, 15.0, 12.0, 20.0],
+        "volume_usd": [100000.0, 80000.0, 95000.0, 60000.0, 110000.0],
+        "prev_volume_usd": [100000.0, 100000.0, 80000.0, 95000.0, 60000.0],
+        "fees_usd": [1000.0, 1200.0, 1140.0, 1200.0, 1100.0],
+        "prev_fees_usd": [1000.0, 1000.0, 1200.0, 1140.0, 1200.0],
+        "pct_change_fee_bps": [0.0, 50.0, -20.0, 66.67, -50.0],
+        "pct_change_volume": [0.0, -20.0, 18.75, -36.84, 83.33],
+        "pct_change_fees": [0.0, 20.0, -5.0, 5.26, -8.33],
+    }
+    return pd.DataFrame(data)
+
+
+@pytest.fixture(scope="session")
+def sample_pool_data():
+    """Sample pool data for pool chart tests (shared per session; do not mutate)."""
+    data = {
+        "pool_name": ["BTC.BTC", "ETH.ETH", "BTC.BTC", "ETH.ETH", "USDC.USDC", "USDC.USDC"],
+        "pool_type": ["BTC", "ETH", "BTC", "ETH", "STABLE", "STABLE"],
+        "period_id": [1, 1, 2, 2, 1, 2],
+        "period_start_date": pd.to_datetime(
+            ["2023-01-01", "2023-01-01", "2023-01-08", "2023-01-08", "2023-01-01", "2023-01-08"]
+        ),
+        "final_fee_bps": [10.0, 10.0, 15.0, 15.0, 10.0, 15.0],
+        "fees_usd": [10000.0, 5000.0, 12000.0, 4500.0, 3000.0, 3500.0],
+        "volume_usd": [1000000.0, 500000.0, 900000.0, 450000.0, 300000.0, 280000.0],
+        "swaps_count": [100, 50, 95, 48, 30, 28],
+        "pct_of_period_volume": [0.5, 0.25, 0.52, 0.26, 0.15, 0.16],
+        "pct_change_fee_bps": [0.0, 0.0, 50.0, 50.0, 0.0, 50.0],
+        "pct_change_volume": [0.0, 0.0, -10.0, -10.0, 0.0, -6.67],
+        "pct_change_fees": [0.0, 0.0, 20.0, -10.0, 0.0, 16.67],
+    }
+    return pd.DataFrame(data)
+
+
+@pytest.fixture(scope="session")
+def built_charts(sample_elasticity_data):
+    """Charts built once from the default sample data for tests that only inspect them."""
+    return {
+        "volume_footprint": create_volume_footprint_chart(sample_elasticity_data),
+        "fee_revenue_lightweight": create_fee_revenue_lightweight_chart(sample_elasticity_data),
+        "fee_volume_lightweight": create_fee_volume_lightweight_chart(sample_elasticity_data),
+        "fee_revenue_dual_axis": create_fee_revenue_dual_axis(sample_elasticity_data),
+    }
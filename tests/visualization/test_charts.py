@@ -1,48 +1,28 @@
 """Tests for chart builder functions."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from src.thorchain_fee_analysis.visualization.charts import (
     create_elasticity_scatter,
     create_fee_revenue_dual_axis,
+    create_fee_revenue_lightweight_chart,
+    create_period_comparison_heatmap,
     create_pool_elasticity_heatmap,
     create_pool_elasticity_scatter,
     create_pool_market_share_area,
     create_pool_revenue_treemap,
     create_pool_small_multiples,
+    create_simple_volume_revenue_bars,
     create_volume_footprint_chart,
     create_waterfall_chart,
 )
 
 
-@pytest.fixture
-def sample_elasticity_data():
-    """Sample elasticity data for testing."""
-    data = {
-        "period_id": [1, 2, 3, 4, 5],
-        "period_start_date": pd.to_datetime(
-            ["2023-01-01", "2023-01-08", "2023-01-15", "2023-01-22", "2023-01-29"]
-        ),
-        "period_end_date": pd.to_datetime(
-            ["2023-01-07", "2023-01-14", "2023-01-21", "2023-01-28", "2023-02-04"]
-        ),
-        "final_fee_bps": [10.0, 15.0, 12.0, 20.0, 10.0],
-        "prev_fee_bps": [10.0, 10.0, 15.0, 12.0, 20.0],
-        "volume_usd": [100000.0, 80000.0, 95000.0, 60000.0, 110000.0],
-        "prev_volume_usd": [100000.0, 100000.0, 80000.0, 95000.0, 60000.0],
-        "fees_usd": [1000.0, 1200.0, 1140.0, 1200.0, 1100.0],
-        "prev_fees_usd": [1000.0, 1000.0, 1200.0, 1140.0, 1200.0],
-        "pct_change_fee_bps": [0.0, 50.0, -20.0, 66.67, -50.0],
-        "pct_change_volume": [0.0, -20.0, 18.75, -36.84, 83.33],
-        "pct_change_fees": [0.0, 20.0, -5.0, 5.26, -8.33],
-    }
-    return pd.DataFrame(data)
-
-
-def test_create_volume_footprint_chart(sample_elasticity_data):
+def test_create_volume_footprint_chart(built_charts):
     """Test volume footprint chart creation."""
-    fig = create_volume_footprint_chart(sample_elasticity_data)
+    fig = built_charts["volume_footprint"]
 
     assert fig is not None
     assert hasattr(fig, "data")
@@ -51,9 +31,115 @@ def test_create_volume_footprint_chart(sample_elasticity_data):
     assert "Volume" in fig.layout.yaxis.title.text
 
 
-def test_create_fee_revenue_dual_axis(sample_elasticity_data):
+def test_volume_footprint_single_trace(sample_elasticity_data, built_charts):
+    """Test that all periods are drawn by one bar trace with per-bar widths."""
+    fig = built_charts["volume_footprint"]
+
+    assert len(fig.data) == 1
+    bar = fig.data[0]
+    assert len(bar.x) == len(sample_elasticity_data)
+    assert len(bar.width) == len(sample_elasticity_data)
+    assert bar.customdata.shape == (len(sample_elasticity_data), 3)
+    assert bar.hovertemplate.count("%{") == 6
+
+
+def test_create_fee_revenue_lightweight_chart(sample_elasticity_data, built_charts):
+    """Test lightweight chart series data and tooltips."""
+    charts = built_charts["fee_revenue_lightweight"]
+
+    fee_series, revenue_series = charts[0]["series"]
+    assert len(fee_series["data"]) == len(sample_elasticity_data)
+    assert fee_series["data"][1] == {
+        "time": 1673136000,
+        "value": 5.0,
+        "title": "Fee: 15 bps (+5)",
+    }
+    assert revenue_series["data"][0]["title"] == "Revenue: $1,000 | Fee: 10 bps"
+    assert all(isinstance(point["time"], int) for point in revenue_series["data"])
+
+
+@pytest.mark.parametrize("unit", ["ns", "us", "s"])
+def test_lightweight_chart_timestamps_ignore_resolution(sample_elasticity_data, unit):
+    """Test that Unix times don't depend on datetime storage unit or timezone."""
+    dates = sample_elasticity_data["period_start_date"].astype(f"datetime64[{unit}]")
+    naive = sample_elasticity_data.assign(period_start_date=dates)
+    aware = sample_elasticity_data.assign(period_start_date=dates.dt.tz_localize("UTC"))
+
+    for df in (naive, aware):
+        revenue_series = create_fee_revenue_lightweight_chart(df)[0]["series"][1]
+        assert revenue_series["data"][1]["time"] == 1673136000
+
+
+def test_lightweight_chart_options_not_shared(sample_elasticity_data):
+    """Test that editing one chart's options does not leak into charts built later."""
+    first = create_fee_revenue_lightweight_chart(sample_elasticity_data)
+    first[0]["chart"]["layout"]["textColor"] = "red"
+
+    second = create_fee_revenue_lightweight_chart(sample_elasticity_data)
+
+    assert second[0]["chart"]["layout"]["textColor"] == "black"
+
+
+def test_create_fee_volume_lightweight_chart(built_charts):
+    """Test volume overlay shares fee-change points with the revenue overlay."""
+    volume_charts = built_charts["fee_volume_lightweight"]
+    revenue_charts = built_charts["fee_revenue_lightweight"]
+
+    fee_series, volume_series = volume_charts[0]["series"]
+    assert fee_series == revenue_charts[0]["series"][0]
+    assert volume_series["data"][3] == {
+        "time": 1674345600,
+        "value": 60000.0,
+        "title": "Volume: $60,000 | Fee: 20 bps",
+    }
+
+
+def test_lightweight_chart_downsamples_long_series():
+    """Test that long series are downsampled while keeping every fee change."""
+    n = 5000
+    fees = np.where(np.arange(n) < 2500, 10.0, 25.0)
+    df = pd.DataFrame(
+        {
+            "period_start_date": pd.date_range("2000-01-01", periods=n, freq="D"),
+            "final_fee_bps": fees,
+            "prev_fee_bps": np.concatenate([[10.0], fees[:-1]]),
+            "fees_usd": np.sin(np.arange(n) / 50.0) * 1000 + 2000,
+        }
+    )
+
+    charts = create_fee_revenue_lightweight_chart(df, max_points=500)
+
+    fee_series, revenue_series = charts[0]["series"]
+    assert 500 <= len(revenue_series["data"]) <= 501
+    times = [point["time"] for point in revenue_series["data"]]
+    assert times == sorted(times)
+    assert [p["value"] for p in fee_series["data"] if p["value"] != 0] == [15.0]
+
+
+def test_simple_volume_revenue_bars_normalization(sample_elasticity_data):
+    """Test 0-100 normalization, including an all-zero revenue series."""
+    fig = create_simple_volume_revenue_bars(sample_elasticity_data)
+    assert max(fig.data[0].y) == 100.0
+
+    zero_revenue = sample_elasticity_data.assign(fees_usd=0.0)
+    fig = create_simple_volume_revenue_bars(zero_revenue)
+    assert list(fig.data[1].y) == [0.0] * len(zero_revenue)
+
+
+def test_simple_volume_revenue_bars_skip_nan_rows(sample_elasticity_data):
+    """Test that a NaN volume stays NaN without zeroing the rest of the series."""
+    volume = sample_elasticity_data["volume_usd"].to_numpy(copy=True)
+    volume[1] = np.nan
+    fig = create_simple_volume_revenue_bars(sample_elasticity_data.assign(volume_usd=volume))
+
+    expected = volume * 100.0 / np.nanmax(volume)
+    np.testing.assert_allclose(fig.data[0].y, expected)
+    assert np.isnan(fig.data[0].y[1])
+
+
+def test_create_fee_revenue_dual_axis(built_charts):
     """Test dual-axis fee/revenue chart creation."""
-    fig = create_fee_revenue_dual_axis(sample_elasticity_data)
+    fig = built_charts["fee_revenue_dual_axis"]
 
     assert fig is not None
     assert hasattr(fig, "data")
@@ -64,6 +150,32 @@ def test_create_fee_revenue_dual_axis(sample_elasticity_data):
     assert fig.layout.yaxis2 is not None
 
 
+def test_dual_axis_uses_webgl_for_long_series():
+    """Test that long series switch to Scattergl while weekly data stays SVG."""
+    n = 1500
+    df = pd.DataFrame(
+        {
+            "period_start_date": pd.date_range("2020-01-01", periods=n, freq="D"),
+            "final_fee_bps": 10.0,
+            "fees_usd": np.linspace(1000.0, 2000.0, n),
+        }
+    )
+
+    fig = create_fee_revenue_dual_axis(df)
+
+    assert [trace.type for trace in fig.data] == ["scattergl", "scattergl"]
+    # Long series drop per-point markers on the revenue line
+    assert fig.data[1].mode == "lines"
+
+
+def test_dual_axis_keeps_markers_for_weekly_data(built_charts):
+    """Test that short series keep revenue markers and skip layout transitions."""
+    fig = built_charts["fee_revenue_dual_axis"]
+
+    assert fig.data[1].mode == "lines+markers"
+    assert fig.layout.transition.duration == 0
+
+
 def test_create_elasticity_scatter(sample_elasticity_data):
     """Test elasticity scatter plot creation."""
     chart = create_elasticity_scatter(
@@ -83,6 +195,49 @@ def test_create_elasticity_scatter(sample_elasticity_data):
     assert len(chart_dict["layer"]) == 2
 
 
+def test_elasticity_scatter_regression_precomputed(sample_elasticity_data):
+    """Test that the regression line is fitted server-side over the x range."""
+    chart = create_elasticity_scatter(
+        sample_elasticity_data,
+        "pct_change_fee_bps",
+        "pct_change_volume",
+        "Test Elasticity",
+        "Fee Change (%)",
+        "Volume Change (%)",
+    )
+
+    regression = chart.layer[1]
+    assert "transform" not in regression.to_dict()
+    line = regression.data
+    slope, intercept = np.polyfit(
+        sample_elasticity_data["pct_change_fee_bps"], sample_elasticity_data["pct_change_volume"], 1
+    )
+    assert line["pct_change_fee_bps"].tolist() == [-50.0, 66.67]
+    assert np.allclose(line["pct_change_volume"], slope * line["pct_change_fee_bps"] + intercept)
+
+
+def test_elasticity_scatter_drops_non_finite_rows(sample_elasticity_data):
+    """Test that rows with inf or NaN in plotted columns are left out."""
+    df = sample_elasticity_data.assign(pct_change_volume=[np.nan, -20.0, np.inf, -36.84, -np.inf])
+
+    chart = create_elasticity_scatter(
+        df, "pct_change_fee_bps", "pct_change_volume", "Test", "Fee Change (%)", "Volume Change (%)"
+    )
+
+    assert chart.layer[0].data["period_id"].tolist() == [2, 4]
+
+
+def test_create_period_comparison_heatmap(sample_elasticity_data):
+    """Test heatmap long-format data with one cell per period and metric."""
+    df = sample_elasticity_data.assign(pct_change_swaps=[0.0, 5.0, -5.0, 10.0, -10.0])
+
+    chart = create_period_comparison_heatmap(df)
+
+    assert len(chart.data) == 3 * len(df)
+    assert chart.data["period"].iloc[0] == "P1"
+    assert chart.data["metric"].unique().tolist() == ["Δ Volume", "Δ Fees", "Δ Swaps"]
+
+
 def test_create_waterfall_chart():
     """Test waterfall chart creation."""
     components = [
@@ -111,6 +266,7 @@ def test_volume_footprint_handles_zero_delta(sample_elasticity_data):
 
     assert fig is not None
     assert len(fig.data) > 0
+    assert list(fig.data[0].width) == [86_400_000] * len(df)  # Uniform 1-day bars
 
 
 def test_elasticity_scatter_without_elasticity_value(sample_elasticity_data):
@@ -124,28 +280,6 @@ def test_elasticity_scatter_without_elasticity_value(sample_elasticity_data):
     assert "title" in chart_dict
 
 
-@pytest.fixture
-def sample_pool_data():
-    """Sample pool data for testing pool charts."""
-    data = {
-        "pool_name": ["BTC.BTC", "ETH.ETH", "BTC.BTC", "ETH.ETH", "USDC.USDC", "USDC.USDC"],
-        "pool_type": ["BTC", "ETH", "BTC", "ETH", "STABLE", "STABLE"],
-        "period_id": [1, 1, 2, 2, 1, 2],
-        "period_start_date": pd.to_datetime(
-            ["2023-01-01", "2023-01-01", "2023-01-08", "2023-01-08", "2023-01-01", "2023-01-08"]
-        ),
-        "final_fee_bps": [10.0, 10.0, 15.0, 15.0, 10.0, 15.0],
-        "fees_usd": [10000.0, 5000.0, 12000.0, 4500.0, 3000.0, 3500.0],
-        "volume_usd": [1000000.0, 500000.0, 900000.0, 450000.0, 300000.0, 280000.0],
-        "swaps_count": [100, 50, 95, 48, 30, 28],
-        "pct_of_period_volume": [0.5, 0.25, 0.52, 0.26, 0.15, 0.16],
-        "pct_change_fee_bps": [0.0, 0.0, 50.0, 50.0, 0.0, 50.0],
-        "pct_change_volume": [0.0, 0.0, -10.0, -10.0, 0.0, -6.67],
-        "pct_change_fees": [0.0, 0.0, 20.0, -10.0, 0.0, 16.67],
-    }
-    return pd.DataFrame(data)
-
-
 def test_create_pool_revenue_treemap(sample_pool_data):
     """Test pool revenue treemap creation."""
     fig = create_pool_revenue_treemap(sample_pool_data, pool_type_col="pool_type")
@@ -157,67 +291,70 @@ def test_create_pool_revenue_treemap(sample_pool_data):
     assert "Pool Revenue" in fig.layout.title.text
 
 
-def test_create_pool_small_multiples(sample_pool_data):
-    """Test pool small multiples chart creation."""
-    chart = create_pool_small_multiples(sample_pool_data, top_n=3, metric="fees_usd")
-
-    assert chart is not None
-    assert hasattr(chart, "to_dict")
-    chart_dict = chart.to_dict()
-    assert "facet" in chart_dict or "spec" in chart_dict  # Faceted chart structure
-
-
-def test_create_pool_elasticity_heatmap(sample_pool_data):
-    """Test pool elasticity heatmap creation."""
-    chart = create_pool_elasticity_heatmap(sample_pool_data, metric="pct_change_fees")
-
-    assert chart is not None
-    assert hasattr(chart, "to_dict")
-    chart_dict = chart.to_dict()
-    assert "layer" in chart_dict  # Should have rect + text layers
-
-
-def test_create_pool_elasticity_scatter(sample_pool_data):
-    """Test pool elasticity scatter plot creation."""
-    chart = create_pool_elasticity_scatter(
-        sample_pool_data,
-        x_col="pct_change_fee_bps",
-        y_col="pct_change_volume",
-        color_by="pool_type",
+def test_pool_small_multiples_categorical_pool_names(sample_pool_data):
+    """Test that unobserved categorical pools are not ranked into the top N."""
+    df = sample_pool_data.assign(
+        pool_name=pd.Categorical(
+            sample_pool_data["pool_name"],
+            categories=["BTC.BTC", "ETH.ETH", "USDC.USDC", "DOGE.DOGE"],
+        )
     )
 
-    assert chart is not None
-    assert hasattr(chart, "to_dict")
-    chart_dict = chart.to_dict()
-    # Should have scatter + regression layers
-    assert "layer" in chart_dict
-
+    chart = create_pool_small_multiples(df, top_n=4, metric="fees_usd")
 
-def test_create_pool_market_share_area(sample_pool_data):
-    """Test pool market share area chart creation."""
-    chart = create_pool_market_share_area(sample_pool_data, pool_type_col="pool_type")
+    assert set(chart.data["pool_name"]) == {"BTC.BTC", "ETH.ETH", "USDC.USDC"}
 
-    assert chart is not None
-    assert hasattr(chart, "to_dict")
-    chart_dict = chart.to_dict()
-    assert "mark" in chart_dict
-    assert chart_dict["mark"]["type"] == "area"
 
+@pytest.mark.parametrize(
+    ("builder", "kwargs", "check"),
+    [
+        (
+            create_pool_small_multiples,
+            {"top_n": 3, "metric": "fees_usd"},
+            lambda spec: "facet" in spec,
+        ),
+        (
+            create_pool_elasticity_heatmap,
+            {"metric": "pct_change_fees"},
+            lambda spec: "layer" in spec,  # rect + text layers
+        ),
+        (
+            create_pool_elasticity_scatter,
+            {
+                "x_col": "pct_change_fee_bps",
+                "y_col": "pct_change_volume",
+                "color_by": "pool_type",
+            },
+            lambda spec: "layer" in spec,  # scatter + regression layers
+        ),
+        (
+            create_pool_market_share_area,
+            {"pool_type_col": "pool_type"},
+            lambda spec: spec["mark"]["type"] == "area",
+        ),
+    ],
+    ids=["small_multiples", "elasticity_heatmap", "elasticity_scatter", "market_share_area"],
+)
+def test_create_pool_altair_charts(sample_pool_data, builder, kwargs, check):
+    """Test that each Altair pool chart builds the expected spec structure."""
+    chart = builder(sample_pool_data, **kwargs)
 
-def test_pool_charts_handle_empty_data():
-    """Test that pool charts handle empty data gracefully."""
-    empty_df = pd.DataFrame()
+    assert check(chart.to_dict())
 
-    # These should not raise exceptions
-    try:
-        create_pool_revenue_treemap(empty_df)
-    except Exception:
-        pass  # Expected to fail gracefully
 
-    try:
-        create_pool_small_multiples(empty_df)
-    except Exception:
-        pass  # Expected to fail gracefully
+@pytest.mark.parametrize(
+    "builder",
+    [
+        create_pool_revenue_treemap,
+        create_pool_small_multiples,
+        create_pool_elasticity_heatmap,
+        create_pool_market_share_area,
+    ],
+)
+def test_pool_charts_reject_empty_data(builder):
+    """Test that pool charts fail fast with ValueError on empty data."""
+    with pytest.raises(ValueError, match="No pool data"):
+        builder(pd.DataFrame())
 
 
 def test_pool_elasticity_scatter_insufficient_data():
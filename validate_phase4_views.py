@@ -3,33 +3,12 @@ Validate Phase 4 Views (Read-Only)
 Views have already been created, this script just validates the data
 """
 
-import snowflake.connector
-
-# Connect with thorchain_prod (read-only is fine for validation)
-conn = snowflake.connector.connect(
-    account="DIPQQTY-EIC35197",
-    user="popsql",
-    password="AFA-wct_xzr0gax_uwg",
-    database="9R",
-    schema="FEE_EXPERIMENT",
-    warehouse="SNOWFLAKE_LEARNING_WH",
-    role="DATASHARES_RO",
-)
-
-print("\n" + "=" * 80)
-print("PHASE 4 SQL VALIDATION - READ-ONLY")
-print("=" * 80)
-print("\n✅ Connected to Snowflake\n")
-
-cursor = conn.cursor()
-all_passed = True
+import argparse
+import os
+import sys
 
-# QA 1: Row counts
-print("=" * 80)
-print("QA Check 1: Row Counts")
-print("=" * 80)
-
-sql = """
+# QA queries, submitted together as one multi-statement request
+ROW_COUNTS_SQL = """
 SELECT 'V_POOL_WEEKLY_SUMMARY' AS table_name, COUNT(*) AS row_count
 FROM "9R".FEE_EXPERIMENT.V_POOL_WEEKLY_SUMMARY
 UNION ALL
@@ -40,33 +19,7 @@ SELECT 'FCT_POOL_ELASTICITY_INPUTS', COUNT(*)
 FROM "9R".FEE_EXPERIMENT_MARTS.FCT_POOL_ELASTICITY_INPUTS
 """
 
-cursor.execute(sql)
-results = cursor.fetchall()
-print()
-for row in results:
-    print(f"  {row[0]}: {row[1]:,} rows")
-
-pool_summary_count = [r[1] for r in results if r[0] == "V_POOL_WEEKLY_SUMMARY"][0]
-elasticity_count = [r[1] for r in results if r[0] == "FCT_POOL_ELASTICITY_INPUTS"][0]
-
-if pool_summary_count >= 100:
-    print(f"\n✅ V_POOL_WEEKLY_SUMMARY has {pool_summary_count} rows (≥100 expected)")
-else:
-    print(f"\n⚠️  V_POOL_WEEKLY_SUMMARY has {pool_summary_count} rows (<100)")
-    all_passed = False
-
-if elasticity_count >= 50:
-    print(f"✅ FCT_POOL_ELASTICITY_INPUTS has {elasticity_count} rows (≥50 expected)")
-else:
-    print(f"⚠️  FCT_POOL_ELASTICITY_INPUTS has {elasticity_count} rows (<50)")
-    all_passed = False
-
-# QA 2: Duplicate check
-print("\n" + "=" * 80)
-print("QA Check 2: Duplicate Detection")
-print("=" * 80)
-
-sql = """
+DUPLICATES_SQL = """
 SELECT 'V_POOL_WEEKLY_SUMMARY' AS table_name, COUNT(*) AS duplicate_count
 FROM (
     SELECT period_id, pool_name, COUNT(*) AS cnt
@@ -84,59 +37,31 @@ FROM (
 )
 """
 
-cursor.execute(sql)
-results = cursor.fetchall()
-print()
-for row in results:
-    if row[1] == 0:
-        print(f"✅ {row[0]}: No duplicates")
-    else:
-        print(f"❌ {row[0]}: Found {row[1]} duplicates!")
-        all_passed = False
-
-# QA 3: NULL checks
-print("\n" + "=" * 80)
-print("QA Check 3: NULL Value Detection")
-print("=" * 80)
-
-sql = """
+# NULL checks (QA3) and value ranges (QA6) share one conditional-aggregate scan of the pool view
+COLUMN_CHECKS_SQL = """
 SELECT
     SUM(CASE WHEN period_id IS NULL THEN 1 ELSE 0 END) AS null_period_id,
     SUM(CASE WHEN pool_name IS NULL THEN 1 ELSE 0 END) AS null_pool_name,
     SUM(CASE WHEN pool_type IS NULL THEN 1 ELSE 0 END) AS null_pool_type,
     SUM(CASE WHEN final_fee_bps IS NULL THEN 1 ELSE 0 END) AS null_final_fee_bps,
     SUM(CASE WHEN volume_usd IS NULL THEN 1 ELSE 0 END) AS null_volume_usd,
-    SUM(CASE WHEN fees_usd IS NULL THEN 1 ELSE 0 END) AS null_fees_usd
+    SUM(CASE WHEN fees_usd IS NULL THEN 1 ELSE 0 END) AS null_fees_usd,
+    SUM(CASE WHEN volume_usd < 0 THEN 1 ELSE 0 END) AS negative_volume,
+    SUM(CASE WHEN fees_usd < 0 THEN 1 ELSE 0 END) AS negative_fees,
+    SUM(CASE WHEN final_fee_bps NOT IN (1, 5, 10, 15, 20, 25) THEN 1 ELSE 0 END)
+        AS invalid_fee_tier
 FROM "9R".FEE_EXPERIMENT.V_POOL_WEEKLY_SUMMARY
 """
-
-cursor.execute(sql)
-result = cursor.fetchone()
-has_nulls = False
-print()
-for i, col in enumerate(
-    ["period_id", "pool_name", "pool_type", "final_fee_bps", "volume_usd", "fees_usd"]
-):
-    if result[i] > 0:
-        print(f"❌ {col}: {result[i]} nulls found")
-        has_nulls = True
-        all_passed = False
-
-if not has_nulls:
-    print("✅ No NULLs in key columns")
-
-# QA 4: Reconciliation
-print("\n" + "=" * 80)
-print("QA Check 4: Reconciliation (Pool Sums vs Weekly Totals)")
-print("=" * 80)
-
-sql = """
+# Reconciliation (QA4) and market-share sums (QA5) share one aggregation of the pool view;
+# the LEFT JOIN keeps periods missing from the weekly totals in the share-sum counts
+POOL_TOTALS_SQL = """
 WITH pool_agg AS (
     SELECT
         period_id,
         SUM(volume_usd) AS pool_volume,
         SUM(fees_usd) AS pool_fees,
-        SUM(swaps_count) AS pool_swaps
+        SUM(swaps_count) AS pool_swaps,
+        SUM(pct_of_period_volume) AS volume_share_sum
     FROM "9R".FEE_EXPERIMENT.V_POOL_WEEKLY_SUMMARY
     GROUP BY period_id
 ),
@@ -151,117 +76,16 @@ weekly AS (
 SELECT
     MAX(ABS((p.pool_volume - w.weekly_volume) / w.weekly_volume) * 100) AS max_volume_diff_pct,
     MAX(ABS((p.pool_fees - w.weekly_fees) / w.weekly_fees) * 100) AS max_fees_diff_pct,
-    MAX(ABS((p.pool_swaps - w.weekly_swaps) / w.weekly_swaps) * 100) AS max_swaps_diff_pct
-FROM pool_agg p
-JOIN weekly w ON p.period_id = w.period_id
-"""
-
-cursor.execute(sql)
-result = cursor.fetchone()
-tolerance = 0.01
-vol_diff = result[0]
-fees_diff = result[1]
-swaps_diff = result[2]
-
-print()
-print(f"Max Volume Difference: {vol_diff:.6f}%")
-print(f"Max Fees Difference:   {fees_diff:.6f}%")
-print(f"Max Swaps Difference:  {swaps_diff:.6f}%")
-
-if vol_diff <= tolerance:
-    print(f"\n✅ Volume reconciliation: {vol_diff:.6f}% (≤{tolerance}%)")
-else:
-    print(f"\n❌ Volume reconciliation: {vol_diff:.6f}% (>{tolerance}%)")
-    all_passed = False
-
-if fees_diff <= tolerance:
-    print(f"✅ Fees reconciliation: {fees_diff:.6f}% (≤{tolerance}%)")
-else:
-    print(f"❌ Fees reconciliation: {fees_diff:.6f}% (>{tolerance}%)")
-    all_passed = False
-
-if swaps_diff <= tolerance:
-    print(f"✅ Swaps reconciliation: {swaps_diff:.6f}% (≤{tolerance}%)")
-else:
-    print(f"❌ Swaps reconciliation: {swaps_diff:.6f}% (>{tolerance}%)")
-    all_passed = False
-
-# QA 5: Market share validation
-print("\n" + "=" * 80)
-print("QA Check 5: Market Share Sum Validation")
-print("=" * 80)
-
-sql = """
-SELECT
+    MAX(ABS((p.pool_swaps - w.weekly_swaps) / w.weekly_swaps) * 100) AS max_swaps_diff_pct,
     COUNT(*) AS total_periods,
-    SUM(CASE WHEN ABS(volume_share_sum - 1.0) <= 0.001 THEN 1 ELSE 0 END) AS periods_passing,
-    SUM(CASE WHEN ABS(volume_share_sum - 1.0) > 0.001 THEN 1 ELSE 0 END) AS periods_failing
-FROM (
-    SELECT
-        period_id,
-        SUM(pct_of_period_volume) AS volume_share_sum
-    FROM "9R".FEE_EXPERIMENT.V_POOL_WEEKLY_SUMMARY
-    GROUP BY period_id
-)
+    SUM(CASE WHEN ABS(p.volume_share_sum - 1.0) <= 0.001 THEN 1 ELSE 0 END) AS periods_passing,
+    SUM(CASE WHEN ABS(p.volume_share_sum - 1.0) > 0.001 THEN 1 ELSE 0 END) AS periods_failing
+FROM pool_agg p
+LEFT JOIN weekly w ON p.period_id = w.period_id
 """
 
-cursor.execute(sql)
-result = cursor.fetchone()
-print()
-print(f"Total periods: {result[0]}")
-print(f"Periods passing: {result[1]}")
-print(f"Periods failing: {result[2]}")
-
-if result[2] == 0:
-    print(f"\n✅ All {result[0]} periods have valid share sums (≈1.0)")
-else:
-    print(f"\n❌ {result[2]} periods have invalid share sums")
-    all_passed = False
-
-# QA 6: Value ranges
-print("\n" + "=" * 80)
-print("QA Check 6: Value Range Validation")
-print("=" * 80)
-
-sql = """
-SELECT
-    'Negative volume' AS check_type,
-    COUNT(*) AS issue_count
-FROM "9R".FEE_EXPERIMENT.V_POOL_WEEKLY_SUMMARY
-WHERE volume_usd < 0
-UNION ALL
-SELECT
-    'Negative fees',
-    COUNT(*)
-FROM "9R".FEE_EXPERIMENT.V_POOL_WEEKLY_SUMMARY
-WHERE fees_usd < 0
-UNION ALL
-SELECT
-    'Invalid fee tier',
-    COUNT(*)
-FROM "9R".FEE_EXPERIMENT.V_POOL_WEEKLY_SUMMARY
-WHERE final_fee_bps NOT IN (1, 5, 10, 15, 20, 25)
-"""
-
-cursor.execute(sql)
-results = cursor.fetchall()
-has_issues = False
-print()
-for row in results:
-    if row[1] > 0:
-        print(f"❌ {row[0]}: {row[1]} issues found")
-        has_issues = True
-        all_passed = False
-
-if not has_issues:
-    print("✅ All value ranges are valid")
-
-# QA 7: Sample data preview
-print("\n" + "=" * 80)
-print("QA Check 7: Sample Data Preview")
-print("=" * 80)
-
-sql = """
+# Preview filters to the first period so only its micro-partitions are scanned and sorted
+PREVIEW_SQL = """
 SELECT
     period_id,
     pool_name,
@@ -271,40 +95,335 @@ SELECT
     pct_change_volume,
     pct_change_fees
 FROM "9R".FEE_EXPERIMENT_MARTS.FCT_POOL_ELASTICITY_INPUTS
-ORDER BY period_start_date, pool_name
+WHERE period_start_date = (
+    SELECT MIN(period_start_date) FROM "9R".FEE_EXPERIMENT_MARTS.FCT_POOL_ELASTICITY_INPUTS
+)
+ORDER BY pool_name
 LIMIT 5
 """
 
-cursor.execute(sql)
-results = cursor.fetchall()
-print("\nFirst 5 rows of FCT_POOL_ELASTICITY_INPUTS:")
-print(
-    f"\n{'Period':<8} {'Pool':<20} {'Type':<12} {'Fee':<6} {'Δ Fee %':<10} {'Δ Vol %':<10} {'Δ Rev %':<10}"
-)
-print("-" * 86)
-for row in results:
+# Reconciliation and share sums must reflect freshly rebuilt views, so the result cache is
+# switched off around them; the other checks may be answered from the cache
+RESULT_CACHE_OFF_SQL = "ALTER SESSION SET USE_CACHED_RESULT = FALSE"
+RESULT_CACHE_ON_SQL = "ALTER SESSION SET USE_CACHED_RESULT = TRUE"
+SESSION_STATEMENTS = {RESULT_CACHE_OFF_SQL, RESULT_CACHE_ON_SQL}
+
+QA_STATEMENTS = [
+    ROW_COUNTS_SQL,
+    DUPLICATES_SQL,
+    COLUMN_CHECKS_SQL,
+    RESULT_CACHE_OFF_SQL,
+    POOL_TOTALS_SQL,
+    RESULT_CACHE_ON_SQL,
+    PREVIEW_SQL,
+]
+
+# Synthetic result sets for --dry-run, one per QA statement, shaped like passing results
+DRY_RUN_RESULTS = [
+    [
+        ("V_POOL_WEEKLY_SUMMARY", 240),
+        ("INT_POOL_ELASTICITY_INPUTS", 220),
+        ("FCT_POOL_ELASTICITY_INPUTS", 220),
+    ],
+    [("V_POOL_WEEKLY_SUMMARY", 0), ("FCT_POOL_ELASTICITY_INPUTS", 0)],
+    [(0, 0, 0, 0, 0, 0, 0, 0, 0)],
+    [(0.0, 0.0, 0.0, 12, 12, 0)],
+    [
+        (2, "BTC.BTC", "btc", 15, 50.0, -4.2, 43.7),
+        (2, "ETH.ETH", "eth", 15, 50.0, -6.8, 39.8),
+    ],
+]
+
+
+def connect():
+    """
+    Open a Snowflake connection from environment variables.
+
+    Credentials come from SNOWFLAKE_ACCOUNT, SNOWFLAKE_USER and SNOWFLAKE_PASSWORD;
+    the database, schema, warehouse and role default to the read-only validation context.
+
+    Returns:
+        snowflake.connector connection
+    """
+    import snowflake.connector
+
+    return snowflake.connector.connect(
+        account=os.environ["SNOWFLAKE_ACCOUNT"],
+        user=os.environ["SNOWFLAKE_USER"],
+        password=os.environ["SNOWFLAKE_PASSWORD"],
+        database=os.getenv("SNOWFLAKE_DATABASE", "9R"),
+        schema=os.getenv("SNOWFLAKE_SCHEMA", "FEE_EXPERIMENT"),
+        warehouse=os.getenv("SNOWFLAKE_WAREHOUSE", "SNOWFLAKE_LEARNING_WH"),
+        role=os.getenv("SNOWFLAKE_ROLE", "DATASHARES_RO"),
+    )
+
+
+def dry_run_connection(results=None):
+    """
+    Build a mock connection whose cursor replays precomputed result sets.
+
+    Args:
+        results: One list of row tuples per QA statement (defaults to DRY_RUN_RESULTS)
+
+    Returns:
+        MagicMock standing in for a snowflake.connector connection
+    """
+    from unittest.mock import MagicMock
+
+    results = iter(DRY_RUN_RESULTS if results is None else results)
+    # Session statements return a status row, like the real driver
+    result_sets = [
+        [("Statement executed successfully.",)] if sql in SESSION_STATEMENTS else next(results)
+        for sql in QA_STATEMENTS
+    ]
+    cursor = MagicMock()
+    cursor.fetchall.side_effect = result_sets
+    # nextset() returns a truthy value while more result sets remain
+    cursor.nextset.side_effect = [True] * (len(result_sets) - 1) + [None]
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+    return conn
+
+
+def fetch_qa_results(conn):
+    """
+    Run every QA query in one round trip and collect the result sets.
+
+    Snowflake compiles and executes the statements server-side and the results are
+    read back statement by statement with nextset().
+
+    Args:
+        conn: Open snowflake.connector connection (or a mock of one)
+
+    Returns:
+        List of result sets, one per QA check (session statements are dropped)
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute(";\n".join(QA_STATEMENTS), num_statements=len(QA_STATEMENTS))
+        result_sets = [cursor.fetchall()]
+        while cursor.nextset():
+            result_sets.append(cursor.fetchall())
+    finally:
+        cursor.close()
+    return [
+        rows
+        for sql, rows in zip(QA_STATEMENTS, result_sets, strict=True)
+        if sql not in SESSION_STATEMENTS
+    ]
+
+
+def run_qa(conn):
+    """
+    Run the Phase 4 QA checks against an injected connection and print the results.
+
+    Args:
+        conn: Open snowflake.connector connection (or a mock of one)
+
+    Returns:
+        True if every check passed
+    """
+    (
+        row_count_rows,
+        duplicate_rows,
+        column_check_rows,
+        pool_total_rows,
+        preview_rows,
+    ) = fetch_qa_results(conn)
+
+    all_passed = True
+
+    # QA 1: Row counts
+    print("=" * 80)
+    print("QA Check 1: Row Counts")
+    print("=" * 80)
+
+    results = row_count_rows
+    print()
+    for row in results:
+        print(f"  {row[0]}: {row[1]:,} rows")
+
+    pool_summary_count = [r[1] for r in results if r[0] == "V_POOL_WEEKLY_SUMMARY"][0]
+    elasticity_count = [r[1] for r in results if r[0] == "FCT_POOL_ELASTICITY_INPUTS"][0]
+
+    if pool_summary_count >= 100:
+        print(f"\n✅ V_POOL_WEEKLY_SUMMARY has {pool_summary_count} rows (≥100 expected)")
+    else:
+        print(f"\n⚠️  V_POOL_WEEKLY_SUMMARY has {pool_summary_count} rows (<100)")
+        all_passed = False
+
+    if elasticity_count >= 50:
+        print(f"✅ FCT_POOL_ELASTICITY_INPUTS has {elasticity_count} rows (≥50 expected)")
+    else:
+        print(f"⚠️  FCT_POOL_ELASTICITY_INPUTS has {elasticity_count} rows (<50)")
+        all_passed = False
+
+    # QA 2: Duplicate check
+    print("\n" + "=" * 80)
+    print("QA Check 2: Duplicate Detection")
+    print("=" * 80)
+
+    results = duplicate_rows
+    print()
+    for row in results:
+        if row[1] == 0:
+            print(f"✅ {row[0]}: No duplicates")
+        else:
+            print(f"❌ {row[0]}: Found {row[1]} duplicates!")
+            all_passed = False
+
+    # QA 3: NULL checks
+    print("\n" + "=" * 80)
+    print("QA Check 3: NULL Value Detection")
+    print("=" * 80)
+
+    column_checks = column_check_rows[0]
+    has_nulls = False
+    print()
+    for i, col in enumerate(
+        ["period_id", "pool_name", "pool_type", "final_fee_bps", "volume_usd", "fees_usd"]
+    ):
+        if column_checks[i] > 0:
+            print(f"❌ {col}: {column_checks[i]} nulls found")
+            has_nulls = True
+            all_passed = False
+
+    if not has_nulls:
+        print("✅ No NULLs in key columns")
+
+    # QA 4: Reconciliation
+    print("\n" + "=" * 80)
+    print("QA Check 4: Reconciliation (Pool Sums vs Weekly Totals)")
+    print("=" * 80)
+
+    pool_totals = pool_total_rows[0]
+    tolerance = 0.01
+    vol_diff, fees_diff, swaps_diff = pool_totals[:3]
+
+    print()
+    print(f"Max Volume Difference: {vol_diff:.6f}%")
+    print(f"Max Fees Difference:   {fees_diff:.6f}%")
+    print(f"Max Swaps Difference:  {swaps_diff:.6f}%")
+
+    if vol_diff <= tolerance:
+        print(f"\n✅ Volume reconciliation: {vol_diff:.6f}% (≤{tolerance}%)")
+    else:
+        print(f"\n❌ Volume reconciliation: {vol_diff:.6f}% (>{tolerance}%)")
+        all_passed = False
+
+    if fees_diff <= tolerance:
+        print(f"✅ Fees reconciliation: {fees_diff:.6f}% (≤{tolerance}%)")
+    else:
+        print(f"❌ Fees reconciliation: {fees_diff:.6f}% (>{tolerance}%)")
+        all_passed = False
+
+    if swaps_diff <= tolerance:
+        print(f"✅ Swaps reconciliation: {swaps_diff:.6f}% (≤{tolerance}%)")
+    else:
+        print(f"❌ Swaps reconciliation: {swaps_diff:.6f}% (>{tolerance}%)")
+        all_passed = False
+
+    # QA 5: Market share validation
+    print("\n" + "=" * 80)
+    print("QA Check 5: Market Share Sum Validation")
+    print("=" * 80)
+
+    result = pool_totals[3:]
+    print()
+    print(f"Total periods: {result[0]}")
+    print(f"Periods passing: {result[1]}")
+    print(f"Periods failing: {result[2]}")
+
+    if result[2] == 0:
+        print(f"\n✅ All {result[0]} periods have valid share sums (≈1.0)")
+    else:
+        print(f"\n❌ {result[2]} periods have invalid share sums")
+        all_passed = False
+
+    # QA 6: Value ranges
+    print("\n" + "=" * 80)
+    print("QA Check 6: Value Range Validation")
+    print("=" * 80)
+
+    results = zip(
+        ["Negative volume", "Negative fees", "Invalid fee tier"], column_checks[6:], strict=True
+    )
+    has_issues = False
+    print()
+    for row in results:
+        if row[1] > 0:
+            print(f"❌ {row[0]}: {row[1]} issues found")
+            has_issues = True
+            all_passed = False
+
+    if not has_issues:
+        print("✅ All value ranges are valid")
+
+    # QA 7: Sample data preview
+    print("\n" + "=" * 80)
+    print("QA Check 7: Sample Data Preview")
+    print("=" * 80)
+
+    results = preview_rows
+    print("\nFirst 5 rows of FCT_POOL_ELASTICITY_INPUTS:")
     print(
-        f"{row[0]:<8} {row[1][:18]:<20} {row[2]:<12} {row[3]:<6.0f} {row[4]:>9.2f} {row[5]:>9.2f} {row[6]:>9.2f}"
+        f"\n{'Period':<8} {'Pool':<20} {'Type':<12} {'Fee':<6} {'Δ Fee %':<10} {'Δ Vol %':<10} {'Δ Rev %':<10}"
     )
+    print("-" * 86)
+    for row in results:
+        print(
+            f"{row[0]:<8} {row[1][:18]:<20} {row[2]:<12} {row[3]:<6.0f} {row[4]:>9.2f} {row[5]:>9.2f} {row[6]:>9.2f}"
+        )
+
+    return all_passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate Phase 4 views (read-only)")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Replay synthetic results through a mock connection instead of Snowflake",
+    )
+    args = parser.parse_args()
+
+    print("\n" + "=" * 80)
+    print("PHASE 4 SQL VALIDATION - READ-ONLY")
+    print("=" * 80)
+
+    if args.dry_run:
+        conn = dry_run_connection()
+        print("\n🧪 Dry run: using synthetic results\n")
+    else:
+        conn = connect()
+        print("\n✅ Connected to Snowflake\n")
+
+    try:
+        all_passed = run_qa(conn)
+    finally:
+        conn.close()
+
+    # Final summary
+    print("\n" + "=" * 80)
+    print("FINAL SUMMARY")
+    print("=" * 80)
+
+    if all_passed:
+        print("\n" + "🎉" * 40)
+        print("✅ ALL QA CHECKS PASSED!")
+        print("Phase 4 models are validated and ready for production.")
+        print("🎉" * 40)
+        print("\n📋 Next step: Launch the dashboard")
+        print("   Run: pdm run dashboard")
+        print("   Or:  streamlit run dashboards/app/Home.py")
+    else:
+        print("\n" + "⚠️ " * 40)
+        print("❌ SOME QA CHECKS FAILED")
+        print("Please review the issues above.")
+        print("⚠️ " * 40)
+
+    return 0 if all_passed else 1
+
 
-cursor.close()
-conn.close()
-
-# Final summary
-print("\n" + "=" * 80)
-print("FINAL SUMMARY")
-print("=" * 80)
-
-if all_passed:
-    print("\n" + "🎉" * 40)
-    print("✅ ALL QA CHECKS PASSED!")
-    print("Phase 4 models are validated and ready for production.")
-    print("🎉" * 40)
-    print("\n📋 Next step: Launch the dashboard")
-    print("   Run: pdm run dashboard")
-    print("   Or:  streamlit run dashboards/app/Home.py")
-else:
-    print("\n" + "⚠️ " * 40)
-    print("❌ SOME QA CHECKS FAILED")
-    print("Please review the issues above.")
-    print("⚠️ " * 40)
+if __name__ == "__main__":
+    sys.exit(main())